@@ -6,8 +6,7 @@ import logging
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
-from collections import defaultdict
+from typing import Any, Dict, Iterator, Optional
 
 import click
 from dotenv import load_dotenv
@@ -20,22 +19,23 @@ from src.config.settings import settings
 from src.models.jira_models import EpicDownloadResult
 from src.utils.file_utils import (
     ensure_directory_exists,
-    extract_text_from_adf,
     format_file_size,
     generate_timestamp_filename,
     get_file_size,
+    save_text,
 )
 from src.utils.jira_formatters import (
     format_date,
     get_issue_status_emoji,
-    get_issue_type_emoji,
     get_priority_emoji,
 )
 from src.utils.markdown_generators import (
-    generate_summary_statistics,
+    issues_to_readable_dicts,
+    terminate_lines,
+    generate_stats_and_groups,
     generate_statistics_markdown,
     generate_table_of_contents,
-    generate_issue_section,
+    iter_issue_section,
     generate_export_footer,
 )
 from src.utils.cli_helpers import (
@@ -43,6 +43,7 @@ from src.utils.cli_helpers import (
     validate_settings,
     print_success_message,
     handle_download_error,
+    run_async,
 )
 
 # Load environment variables
@@ -50,81 +51,68 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Static markdown blocks, built once at import instead of line by line per render
+_SUMMARY_STATS_HEADER = "## 📊 Summary Statistics\n\n"
+_ALL_ISSUES_HEADER = "## 🎫 All Issues\n\n"
 
-def create_markdown_from_epic_data(
-    epic_data, jira_base_url="https://mercari.atlassian.net"
-):
-    """Convert epic data to markdown format."""
 
-    # Start building markdown content
-    md_content = []
+def iter_markdown_from_epic_data(
+    epic_data: Dict[str, Any], jira_base_url: str = "https://mercari.atlassian.net"
+) -> Iterator[str]:
+    """Convert epic data to markdown, yielding newline-terminated chunks."""
 
     # Title and Epic Information
     epic_key = epic_data["epic_key"]
     epic_summary = epic_data["epic_summary"]
-    md_content.append(
-        f"# Epic: [{epic_key}]({jira_base_url}/browse/{epic_key}) - {epic_summary}"
+    yield (
+        f"# Epic: [{epic_key}]({jira_base_url}/browse/{epic_key}) - {epic_summary}\n"
     )
-    md_content.append("")
-    md_content.append(
-        f"**Download Date:** {format_date(epic_data.get('download_timestamp', ''))}"
+    yield "\n"
+    yield (
+        f"**Download Date:** {format_date(epic_data.get('download_timestamp', ''))}\n"
     )
-    md_content.append(f"**Total Issues:** {epic_data['total_issues']}")
-    md_content.append(f"**Total Sub-tasks:** {epic_data.get('total_subtasks', 0)}")
-    md_content.append("")
+    yield f"**Total Issues:** {epic_data['total_issues']}\n"
+    yield f"**Total Sub-tasks:** {epic_data.get('total_subtasks', 0)}\n"
+    yield "\n"
 
     # Generate summary statistics
     issues = epic_data["issues"]
     subtasks = epic_data.get("subtasks", {})
 
-    stats = generate_summary_statistics(issues, subtasks)
+    stats, issues_by_type = generate_stats_and_groups(issues, subtasks)
 
     # Summary Statistics
-    md_content.append("## 📊 Summary Statistics")
-    md_content.append("")
-    md_content.extend(generate_statistics_markdown(stats))
+    yield _SUMMARY_STATS_HEADER
+    yield from terminate_lines(generate_statistics_markdown(stats))
 
     # Table of Contents
-    md_content.extend(generate_table_of_contents(list(stats["issue_types"].keys())))
+    yield from terminate_lines(
+        generate_table_of_contents(list(stats["issue_types"].keys()))
+    )
 
     # All Issues Section
-    md_content.append("## 🎫 All Issues")
-    md_content.append("")
-
-    # Group issues by type
-    issues_by_type = defaultdict(list)
-    for issue in issues:
-        issue_type = issue["fields"]["issue_type"]["name"]
-        issues_by_type[issue_type].append(issue)
+    yield _ALL_ISSUES_HEADER
 
     # Generate sections for each issue type
-    for issue_type in sorted(issues_by_type.keys()):
-        type_emoji = get_issue_type_emoji(issue_type)
-        md_content.append(f"### 🔸 {issue_type}")
-        md_content.append("")
-
-        type_issues = issues_by_type[issue_type]
+    for issue_type, type_issues in issues_by_type.items():
+        yield f"### 🔸 {issue_type}\n"
+        yield "\n"
 
+        # Only stories carry sub-tasks; every issue in this group shares a type
+        is_story = issue_type == "Story"
         for issue in type_issues:
             # Use the shared function to generate issue section
-            story_subtasks = None
-            if (
-                issue["fields"]["issue_type"]["name"] == "Story"
-                and issue["key"] in subtasks
-            ):
-                story_subtasks = subtasks[issue["key"]]
-
-            md_content.extend(
-                generate_issue_section(
-                    issue,
-                    jira_base_url,
-                    include_subtasks=story_subtasks is not None,
-                    subtasks=story_subtasks,
-                )
+            story_subtasks = subtasks.get(issue["key"]) if is_story else None
+
+            yield from iter_issue_section(
+                issue,
+                jira_base_url,
+                include_subtasks=story_subtasks is not None,
+                subtasks=story_subtasks,
             )
 
     # Footer
-    md_content.extend(
+    yield from terminate_lines(
         generate_export_footer(
             "Epic",
             epic_key,
@@ -136,7 +124,12 @@ def create_markdown_from_epic_data(
         )
     )
 
-    return "\n".join(md_content)
+
+def create_markdown_from_epic_data(
+    epic_data: Dict[str, Any], jira_base_url: str = "https://mercari.atlassian.net"
+) -> str:
+    """Convert epic data to markdown format."""
+    return "".join(iter_markdown_from_epic_data(epic_data, jira_base_url))
 
 
 async def download_epic_issues(
@@ -144,6 +137,7 @@ async def download_epic_issues(
     output_dir: Optional[str] = None,
     output_filename: Optional[str] = None,
     include_subtasks: bool = True,
+    concurrency: int = 8,
 ) -> EpicDownloadResult:
     """Download all issues from a Jira epic and save to Markdown.
 
@@ -152,6 +146,9 @@ async def download_epic_issues(
         output_dir: Output directory for the Markdown file
         output_filename: Custom filename for the output file
         include_subtasks: Whether to fetch sub-tasks for stories
+        concurrency: Maximum number of ``parent in (...)`` sub-task searches
+            run at once. Each search covers up to 100 stories; the result
+            pages of one search are fetched without this limit
 
     Returns:
         EpicDownloadResult with download information
@@ -188,87 +185,91 @@ async def download_epic_issues(
 
             if include_subtasks:
                 logger.info("Fetching sub-tasks for stories in the epic...")
-                for issue in issues:
-                    if issue.fields.issue_type.name == "Story":
-                        logger.info(f"Fetching sub-tasks for story {issue.key}...")
-                        story_subtasks = await jira.get_story_subtasks(issue.key)
-                        if story_subtasks:
-                            subtasks_by_story[issue.key] = story_subtasks
-                            total_subtasks += len(story_subtasks)
-                            logger.info(
-                                f"Found {len(story_subtasks)} sub-tasks for story {issue.key}"
-                            )
+                # One parent-in search per chunk of stories, not one per story
+                results = await jira.get_subtasks_for_stories(
+                    [
+                        issue.key
+                        for issue in issues
+                        if issue.fields.issue_type.name == "Story"
+                    ],
+                    concurrency=concurrency,
+                )
 
+                for story_key, story_subtasks in results.items():
+                    if story_subtasks:
+                        subtasks_by_story[story_key] = story_subtasks
+                        logger.info(
+                            f"Found {len(story_subtasks)} sub-tasks "
+                            f"for story {story_key}"
+                        )
+
+                total_subtasks = sum(len(v) for v in subtasks_by_story.values())
                 logger.info(f"Total sub-tasks found: {total_subtasks}")
             else:
                 logger.info("Skipping sub-task fetching as requested")
 
             # Create result object with readable issue data
             logger.info("Processing issues and extracting descriptions...")
-            readable_issues = []
-            for issue in issues:
-                issue_data = issue.model_dump()
-                # Extract readable text from description
-                if issue_data["fields"]["description"]:
-                    issue_data["fields"]["description_text"] = extract_text_from_adf(
-                        issue_data["fields"]["description"]
-                    )
-                readable_issues.append(issue_data)
+            # Dump models and walk ADF descriptions off the event loop
+            loop = asyncio.get_running_loop()
+            readable_issues_task = loop.run_in_executor(
+                None, issues_to_readable_dicts, issues
+            )
 
             # Process sub-tasks and extract descriptions (if we have sub-tasks)
             readable_subtasks_by_story = {}
             if include_subtasks and subtasks_by_story:
                 logger.info("Processing sub-tasks and extracting descriptions...")
-                for story_key, story_subtasks in subtasks_by_story.items():
-                    readable_subtasks = []
-                    for subtask in story_subtasks:
-                        subtask_data = subtask.model_dump()
-                        # Extract readable text from description
-                        if subtask_data["fields"]["description"]:
-                            subtask_data["fields"]["description_text"] = (
-                                extract_text_from_adf(
-                                    subtask_data["fields"]["description"]
-                                )
-                            )
-                        readable_subtasks.append(subtask_data)
-                    readable_subtasks_by_story[story_key] = readable_subtasks
+                story_keys = list(subtasks_by_story)
+                readable_subtasks = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            None, issues_to_readable_dicts, subtasks_by_story[key]
+                        )
+                        for key in story_keys
+                    )
+                )
+                readable_subtasks_by_story = dict(zip(story_keys, readable_subtasks))
+
+            readable_issues = await readable_issues_task
 
             # Create epic data structure
+            download_timestamp = datetime.now()
+            total_issues = len(issues)
             epic_data = {
                 "epic_key": epic_key,
                 "epic_summary": epic_info.fields.summary,
-                "total_issues": len(issues),
+                "total_issues": total_issues,
                 "total_subtasks": total_subtasks,
                 "issues": readable_issues,
                 "subtasks": readable_subtasks_by_story,
-                "download_timestamp": datetime.now().isoformat(),
+                "download_timestamp": download_timestamp.isoformat(),
             }
 
-            # Generate markdown content
-            logger.info("Generating markdown content...")
-            markdown_content = create_markdown_from_epic_data(epic_data)
-
-            # Save markdown to file
-            logger.info("Saving markdown file...")
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(markdown_content)
+            # Render and stream markdown to file without blocking the event loop
+            logger.info("Generating and saving markdown file...")
+            markdown_chunks = iter_markdown_from_epic_data(epic_data)
+            await loop.run_in_executor(
+                None, save_text, markdown_chunks, str(output_path)
+            )
 
             # Create result object for return
             result = EpicDownloadResult(
                 epic_key=epic_key,
                 epic_summary=epic_info.fields.summary,
-                total_issues=len(issues),
+                total_issues=total_issues,
                 total_subtasks=total_subtasks,
                 issues=issues,
                 subtasks=subtasks_by_story,
-                download_timestamp=datetime.now(),
+                download_timestamp=download_timestamp,
                 output_file=str(output_path),
             )
 
             # Log success information
             file_size = get_file_size(str(output_path))
             logger.info(
-                f"Successfully downloaded {len(issues)} issues and {total_subtasks} sub-tasks"
+                f"Successfully downloaded {total_issues} issues "
+                f"and {total_subtasks} sub-tasks"
             )
             logger.info(f"Markdown file: {output_path} ({format_file_size(file_size)})")
 
@@ -304,12 +305,24 @@ async def download_epic_issues(
     is_flag=True,
     help="Skip fetching sub-tasks for stories (faster execution)",
 )
+@click.option(
+    "--concurrency",
+    "-c",
+    default=8,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help=(
+        "Maximum number of batched sub-task searches (up to 100 stories each) "
+        "run at once"
+    ),
+)
 def main(
     epic_key: str,
     output_dir: Optional[str],
     output_filename: Optional[str],
     verbose: bool,
     no_subtasks: bool,
+    concurrency: int,
 ) -> None:
     """Download all issues from a Jira epic and save them to Markdown.
 
@@ -320,18 +333,20 @@ def main(
         python download_epic_issues.py PROJ-123 -o ./exports
         python download_epic_issues.py PROJ-123 -f my_epic_issues.md
         python download_epic_issues.py PROJ-123 --no-subtasks
+        python download_epic_issues.py PROJ-123 --concurrency 4
     """
     setup_logging(verbose)
     validate_settings(verbose)
 
     # Run the download
     try:
-        result = asyncio.run(
+        result = run_async(
             download_epic_issues(
                 epic_key=epic_key,
                 output_dir=output_dir,
                 output_filename=output_filename,
                 include_subtasks=not no_subtasks,
+                concurrency=concurrency,
             )
         )
 
@@ -6,8 +6,7 @@ import logging
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
-from collections import defaultdict
+from typing import Any, Dict, Iterator, Optional
 
 import click
 from dotenv import load_dotenv
@@ -20,24 +19,26 @@ from src.config.settings import settings
 from src.models.jira_models import StoryDownloadResult
 from src.utils.file_utils import (
     ensure_directory_exists,
-    extract_text_from_adf,
     format_file_size,
     generate_timestamp_filename,
     get_file_size,
+    save_text,
 )
 from src.utils.jira_formatters import (
     format_date,
     get_issue_status_emoji,
-    get_issue_type_emoji,
     get_priority_emoji,
     format_issue_details_table,
     format_description_blockquote,
 )
 from src.utils.markdown_generators import (
-    generate_summary_statistics,
+    issues_to_readable_dicts,
+    terminate_lines,
+    generate_stats_and_groups,
     generate_statistics_markdown,
     generate_table_of_contents,
-    generate_issue_section,
+    heading_anchor,
+    iter_issue_section,
     generate_export_footer,
 )
 from src.utils.cli_helpers import (
@@ -45,6 +46,7 @@ from src.utils.cli_helpers import (
     validate_settings,
     print_success_message,
     handle_download_error,
+    run_async,
 )
 
 # Load environment variables
@@ -52,126 +54,125 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Static markdown blocks, built once at import instead of line by line per render
+_STORY_INFO_HEADER = "## 📖 Story Information\n\n"
+_STORY_DESCRIPTION_HEADER = "### 📝 Story Description\n\n"
+_SUBTASK_STATS_HEADER = "## 📊 Sub-tasks Summary Statistics\n\n"
+_STORY_TOC_HEADER = (
+    "## 📋 Table of Contents\n"
+    "\n"
+    "- [Story Information](#📖-story-information)\n"
+    "- [Sub-tasks Summary Statistics](#📊-sub-tasks-summary-statistics)\n"
+    "- [All Sub-tasks](#📋-all-sub-tasks)\n"
+)
+_ALL_SUBTASKS_HEADER = "## 📋 All Sub-tasks\n\n"
+_NO_SUBTASKS_SECTION = "## 📋 Sub-tasks\n\nNo sub-tasks found for this story.\n\n"
 
-def create_markdown_from_story_data(
-    story_data, jira_base_url="https://mercari.atlassian.net"
-):
-    """Convert story data to markdown format."""
 
-    # Start building markdown content
-    md_content = []
+def iter_markdown_from_story_data(
+    story_data: Dict[str, Any], jira_base_url: str = "https://mercari.atlassian.net"
+) -> Iterator[str]:
+    """Convert story data to markdown, yielding newline-terminated chunks."""
 
     # Title and Story Information
     story_key = story_data["story_key"]
     story_summary = story_data["story_summary"]
-    md_content.append(
-        f"# Story: [{story_key}]({jira_base_url}/browse/{story_key}) - {story_summary}"
+    yield (
+        f"# Story: [{story_key}]({jira_base_url}/browse/{story_key})"
+        f" - {story_summary}\n"
     )
-    md_content.append("")
-    md_content.append(
-        f"**Download Date:** {format_date(story_data.get('download_timestamp', ''))}"
+    yield "\n"
+    yield (
+        f"**Download Date:** {format_date(story_data.get('download_timestamp', ''))}\n"
     )
-    md_content.append(f"**Total Sub-tasks:** {story_data['total_subtasks']}")
-    md_content.append("")
+    yield f"**Total Sub-tasks:** {story_data['total_subtasks']}\n"
+    yield "\n"
 
     # Story Details
     story_info = story_data["story_issue"]
     story_fields = story_info["fields"]
 
     # Story information section
-    md_content.append("## 📖 Story Information")
-    md_content.append("")
+    yield _STORY_INFO_HEADER
 
     # Use shared function for story details table
-    md_content.extend(format_issue_details_table(story_fields))
-    md_content.append("")
+    yield from terminate_lines(format_issue_details_table(story_fields))
+    yield "\n"
 
     # Story Description
     if story_fields.get("description_text"):
-        md_content.append("### 📝 Story Description")
-        md_content.append("")
-        md_content.extend(
+        yield _STORY_DESCRIPTION_HEADER
+        yield from terminate_lines(
             format_description_blockquote(
                 story_fields["description_text"], jira_base_url
             )
         )
-        md_content.append("")
+        yield "\n"
 
-    # Analyze sub-tasks for summary stats
+    # Without sub-tasks there is nothing to aggregate; go straight to footer
     subtasks = story_data["subtasks"]
-    if subtasks:
-        # Generate summary statistics for subtasks
-        stats = generate_summary_statistics(subtasks)
-
-        # Summary Statistics
-        md_content.append("## 📊 Sub-tasks Summary Statistics")
-        md_content.append("")
-        md_content.extend(generate_statistics_markdown(stats))
-
-        # Table of Contents
-        md_content.append("## 📋 Table of Contents")
-        md_content.append("")
-        md_content.append("- [Story Information](#📖-story-information)")
-        md_content.append(
-            "- [Sub-tasks Summary Statistics](#📊-sub-tasks-summary-statistics)"
-        )
-        md_content.append("- [All Sub-tasks](#📋-all-sub-tasks)")
-
-        # Group sub-tasks by type for TOC
-        for issue_type in sorted(stats["issue_types"].keys()):
-            anchor = issue_type.lower().replace(" ", "-").replace("/", "")
-            md_content.append(f"  - [{issue_type}](#🔸-{anchor})")
-        md_content.append("")
-
-        # All Sub-tasks Section
-        md_content.append("## 📋 All Sub-tasks")
-        md_content.append("")
-
-        # Group sub-tasks by type
-        subtasks_by_type = defaultdict(list)
-        for subtask in subtasks:
-            issue_type = subtask["fields"]["issue_type"]["name"]
-            subtasks_by_type[issue_type].append(subtask)
-
-        # Generate sections for each issue type
-        for issue_type in sorted(subtasks_by_type.keys()):
-            type_emoji = get_issue_type_emoji(issue_type)
-            md_content.append(f"### 🔸 {issue_type}")
-            md_content.append("")
-
-            type_subtasks = subtasks_by_type[issue_type]
-
-            for subtask in type_subtasks:
-                # Use the shared function to generate issue section
-                md_content.extend(
-                    generate_issue_section(
-                        subtask,
-                        jira_base_url,
-                        include_subtasks=False,
-                        subtasks=None,
-                    )
-                )
-
-    else:
-        md_content.append("## 📋 Sub-tasks")
-        md_content.append("")
-        md_content.append("No sub-tasks found for this story.")
-        md_content.append("")
-
-    # Footer
-    md_content.extend(
+    if not subtasks:
+        yield _NO_SUBTASKS_SECTION
+        yield from _iter_story_footer(story_data, jira_base_url, 0)
+        return
+
+    # Generate summary statistics and type groups for subtasks
+    stats, subtasks_by_type = generate_stats_and_groups(subtasks)
+
+    # Summary Statistics
+    yield _SUBTASK_STATS_HEADER
+    yield from terminate_lines(generate_statistics_markdown(stats))
+
+    # Table of Contents
+    yield _STORY_TOC_HEADER
+
+    # Group sub-tasks by type for TOC
+    for issue_type in sorted(stats["issue_types"].keys()):
+        yield f"  - [{issue_type}](#🔸-{heading_anchor(issue_type)})\n"
+    yield "\n"
+
+    # All Sub-tasks Section
+    yield _ALL_SUBTASKS_HEADER
+
+    # Generate sections for each issue type
+    for issue_type, type_subtasks in subtasks_by_type.items():
+        yield f"### 🔸 {issue_type}\n"
+        yield "\n"
+
+        for subtask in type_subtasks:
+            # Use the shared function to generate issue section
+            yield from iter_issue_section(
+                subtask,
+                jira_base_url,
+                include_subtasks=False,
+                subtasks=None,
+            )
+
+    yield from _iter_story_footer(story_data, jira_base_url, len(subtasks))
+
+
+def _iter_story_footer(
+    story_data: Dict[str, Any], jira_base_url: str, total_subtasks: int
+) -> Iterator[str]:
+    """Yield the export footer for a story export."""
+    yield from terminate_lines(
         generate_export_footer(
             "Story",
-            story_key,
-            story_summary,
-            len(subtasks),
-            len(subtasks),
+            story_data["story_key"],
+            story_data["story_summary"],
+            total_subtasks,
+            total_subtasks,
             story_data.get("download_timestamp", ""),
             jira_base_url,
         )
     )
 
-    return "\n".join(md_content)
+
+def create_markdown_from_story_data(
+    story_data: Dict[str, Any], jira_base_url: str = "https://mercari.atlassian.net"
+) -> str:
+    """Convert story data to markdown format."""
+    return "".join(iter_markdown_from_story_data(story_data, jira_base_url))
 
 
 async def download_story_subtasks(
@@ -206,69 +207,59 @@ async def download_story_subtasks(
 
     async with JiraClient() as jira:
         try:
-            # Get story information
-            logger.info("Fetching story information...")
-            story_info = await jira.get_story_info(story_key)
+            # Story information and sub-tasks only depend on the key, so
+            # fetch them concurrently
+            logger.info("Fetching story information and sub-tasks...")
+            story_info, subtasks = await asyncio.gather(
+                jira.get_story_info(story_key),
+                jira.get_story_subtasks(story_key),
+            )
             logger.info(f"Story: {story_info.key} - {story_info.fields.summary}")
 
-            # Get all sub-tasks for the story
-            logger.info("Fetching all sub-tasks for the story...")
-            subtasks = await jira.get_story_subtasks(story_key)
-
             # Create result object with readable issue data
             logger.info("Processing story and sub-tasks and extracting descriptions...")
 
-            # Process story info
-            story_data = story_info.model_dump()
-            if story_data["fields"]["description"]:
-                story_data["fields"]["description_text"] = extract_text_from_adf(
-                    story_data["fields"]["description"]
-                )
-
-            # Process sub-tasks
-            readable_subtasks = []
-            for subtask in subtasks:
-                subtask_data = subtask.model_dump()
-                # Extract readable text from description
-                if subtask_data["fields"]["description"]:
-                    subtask_data["fields"]["description_text"] = extract_text_from_adf(
-                        subtask_data["fields"]["description"]
-                    )
-                readable_subtasks.append(subtask_data)
+            # Dump models and walk ADF descriptions off the event loop
+            loop = asyncio.get_running_loop()
+            story_data, *readable_subtasks = await loop.run_in_executor(
+                None, issues_to_readable_dicts, [story_info, *subtasks]
+            )
 
             # Create story data structure
+            download_timestamp = datetime.now()
+            total_subtasks = len(subtasks)
             story_data_export = {
                 "story_key": story_key,
                 "story_summary": story_info.fields.summary,
-                "total_subtasks": len(subtasks),
+                "total_subtasks": total_subtasks,
                 "story_issue": story_data,
                 "subtasks": readable_subtasks,
-                "download_timestamp": datetime.now().isoformat(),
+                "download_timestamp": download_timestamp.isoformat(),
             }
 
-            # Generate markdown content
-            logger.info("Generating markdown content...")
-            markdown_content = create_markdown_from_story_data(story_data_export)
-
-            # Save markdown to file
-            logger.info("Saving markdown file...")
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(markdown_content)
+            # Render and stream markdown to file without blocking the event loop
+            logger.info("Generating and saving markdown file...")
+            markdown_chunks = iter_markdown_from_story_data(story_data_export)
+            await loop.run_in_executor(
+                None, save_text, markdown_chunks, str(output_path)
+            )
 
             # Create result object for return
             result = StoryDownloadResult(
                 story_key=story_key,
                 story_summary=story_info.fields.summary,
-                total_subtasks=len(subtasks),
+                total_subtasks=total_subtasks,
                 story_issue=story_info,
                 subtasks=subtasks,
-                download_timestamp=datetime.now(),
+                download_timestamp=download_timestamp,
                 output_file=str(output_path),
             )
 
             # Log success information
             file_size = get_file_size(str(output_path))
-            logger.info(f"Successfully downloaded story with {len(subtasks)} sub-tasks")
+            logger.info(
+                f"Successfully downloaded story with {total_subtasks} sub-tasks"
+            )
             logger.info(f"Markdown file: {output_path} ({format_file_size(file_size)})")
 
             return result
@@ -318,7 +309,7 @@ def main(
 
     # Run the download
     try:
-        result = asyncio.run(
+        result = run_async(
             download_story_subtasks(
                 story_key=story_key,
                 output_dir=output_dir,
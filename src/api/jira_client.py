@@ -2,19 +2,95 @@
 
 import asyncio
 import logging
-from typing import Dict, List, Optional
+import weakref
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Optional
 
 import aiohttp
-from asyncio_throttle import Throttler
+import orjson
+from pydantic import TypeAdapter
 
 from ..config.settings import settings
 from ..models.jira_models import JiraIssue, JiraSearchResult
+from .rate_limiter import AsyncRateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Page size requested from /search; Jira may cap this lower server-side
+DEFAULT_BATCH_SIZE = 500
+
+# Fields needed to build JiraIssue models and the markdown exports
+DEFAULT_ISSUE_FIELDS = [
+    "summary",
+    "description",
+    "status",
+    "issuetype",
+    "priority",
+    "assignee",
+    "reporter",
+    "project",
+    "created",
+    "updated",
+    "labels",
+    "customfield_10016",  # Story points
+]
+
+# Validates a whole page of issues in one pydantic-core call
+_ISSUE_LIST_ADAPTER = TypeAdapter(List[JiraIssue])
+
+# Retries for rate-limited (HTTP 429) requests, and the backoff base used when
+# Jira does not send a usable Retry-After header
+DEFAULT_MAX_RETRIES = 3
+RETRY_BACKOFF_SECONDS = 1.0
+
+# Key and value types of JiraClient's per-loop connection pool maps
+_Loop = asyncio.AbstractEventLoop
+_ConnectorRef = Callable[[], Optional[aiohttp.TCPConnector]]
+
+
+def _orjson_dumps(obj: Any) -> str:
+    """Serialize request bodies with orjson, matching response decoding."""
+    return orjson.dumps(obj).decode()
+
+
+class JiraAPIError(Exception):
+    """Error response returned by the Jira REST API.
+
+    Attributes:
+        status: HTTP status code of the response
+        msg: Response body, usually Jira's JSON error document
+    """
+
+    __slots__ = ("status", "msg")
+
+    def __init__(self, status: int, msg: str):
+        super().__init__(status, msg)
+        self.status = status
+        self.msg = msg
+
+    def __str__(self) -> str:
+        return f"Jira API returned HTTP {self.status}: {self.msg}"
+
 
 class JiraClient:
-    """Async Jira API client with rate limiting and error handling."""
+    """Async Jira API client with rate limiting and error handling.
+
+    The client keeps a single pooled HTTP session for its lifetime, so one
+    instance should wrap a whole download rather than individual calls.
+    Sessions of the clients open on one event loop share a keep-alive
+    connection pool, which is closed when the last of them closes.
+    """
+
+    # Connection pool shared by the open clients of each event loop, and how
+    # many clients currently use it. A pool references its loop, so it is
+    # held weakly as well; the sessions using it keep it alive. Clients that
+    # are never closed then don't pin their dead loops here.
+    _connectors: "weakref.WeakKeyDictionary[_Loop, _ConnectorRef]" = (
+        weakref.WeakKeyDictionary()
+    )
+    _connector_users: "weakref.WeakKeyDictionary[_Loop, int]" = (
+        weakref.WeakKeyDictionary()
+    )
 
     def __init__(
         self,
@@ -22,6 +98,7 @@ class JiraClient:
         username: Optional[str] = None,
         api_token: Optional[str] = None,
         rate_limit: int = 10,
+        max_retries: int = DEFAULT_MAX_RETRIES,
     ):
         """Initialize Jira client.
 
@@ -30,26 +107,89 @@ class JiraClient:
             username: Jira username
             api_token: Jira API token
             rate_limit: Requests per second limit
+            max_retries: Times to retry a request rejected with HTTP 429
         """
         self.url = url or settings().jira_url
         self.username = username or settings().jira_username
         self.api_token = api_token or settings().jira_api_token
-        self.base_url = f"{self.url.rstrip('/')}/rest/api/3"
 
         # Rate limiting
-        self.throttler = Throttler(rate_limit=rate_limit)
+        self.throttler = AsyncRateLimiter(rate_limit=rate_limit)
+        self.max_retries = max_retries
 
-        # Session will be created when needed
+        # Session will be created when needed, on the loop recorded here
         self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Issues fetched by key during this client's lifetime
+        self._issue_cache: Dict[str, JiraIssue] = {}
+
+    @cached_property
+    def base_url(self) -> str:
+        """Base URL of the Jira REST API v3, built once per client."""
+        return self.url.rstrip("/") + "/rest/api/3"
+
+    @classmethod
+    def _get_connector(cls, loop: _Loop) -> aiohttp.TCPConnector:
+        """Get or create the connection pool shared by the clients of a loop.
+
+        Args:
+            loop: Event loop the connector is used on
+
+        Returns:
+            TCP connector bound to ``loop``
+        """
+        connector_ref = cls._connectors.get(loop)
+        connector = connector_ref() if connector_ref is not None else None
+        if connector is None or connector.closed:
+            connector = aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=64,
+                keepalive_timeout=30,
+                ttl_dns_cache=300,
+            )
+            cls._connectors[loop] = weakref.ref(connector)
+            cls._connector_users[loop] = 0
+        return connector
+
+    async def _release_connector(self) -> None:
+        """Stop counting this client as a user of its loop's shared pool.
+
+        The pool is closed when its last user releases it.
+        """
+        loop, self._session_loop = self._session_loop, None
+        if loop is None:
+            return
+        users = JiraClient._connector_users.get(loop, 0) - 1
+        if users > 0:
+            JiraClient._connector_users[loop] = users
+            return
+        JiraClient._connector_users.pop(loop, None)
+        connector_ref = JiraClient._connectors.pop(loop, None)
+        connector = connector_ref() if connector_ref is not None else None
+        # A pool can only be closed on its own loop, which may be gone by now
+        if connector is not None and loop is asyncio.get_running_loop():
+            await connector.close()
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create HTTP session with authentication."""
         if self._session is None or self._session.closed:
+            # A session closed without close() still counts as a pool user
+            await self._release_connector()
             auth = aiohttp.BasicAuth(self.username, self.api_token)
             timeout = aiohttp.ClientTimeout(total=30)
+            loop = asyncio.get_running_loop()
+            connector = self._get_connector(loop)
+            JiraClient._connector_users[loop] += 1
+            self._session_loop = loop
             self._session = aiohttp.ClientSession(
                 auth=auth,
                 timeout=timeout,
+                connector=connector,
+                connector_owner=False,
+                json_serialize=_orjson_dumps,
+                # Accept-Encoding is left to aiohttp, which offers gzip and
+                # deflate, plus br and zstd when their decoders are installed
                 headers={
                     "Accept": "application/json",
                     "Content-Type": "application/json",
@@ -58,9 +198,10 @@ class JiraClient:
         return self._session
 
     async def close(self) -> None:
-        """Close the HTTP session."""
+        """Close the HTTP session, and the shared pool if no client uses it."""
         if self._session and not self._session.closed:
             await self._session.close()
+        await self._release_connector()
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -79,6 +220,10 @@ class JiraClient:
     ) -> Dict:
         """Make rate-limited HTTP request to Jira API.
 
+        Requests rejected with HTTP 429 are retried up to ``max_retries``
+        times, waiting for Jira's ``Retry-After`` delay or an exponential
+        backoff when the header is missing.
+
         Args:
             method: HTTP method
             endpoint: API endpoint (without base URL)
@@ -89,41 +234,187 @@ class JiraClient:
             JSON response data
 
         Raises:
-            aiohttp.ClientError: For HTTP errors
+            JiraAPIError: For HTTP error responses, including a 429 that is
+                still returned after the last retry
+            aiohttp.ClientError: For connection failures
         """
         session = await self._get_session()
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
 
-        async with self.throttler:
-            logger.debug(f"Making {method} request to {url}")
+        attempt = 0
+        while True:
+            async with self.throttler:
+                logger.debug(f"Making {method} request to {url}")
+
+                async with session.request(
+                    method, url, params=params, json=data
+                ) as response:
+                    if response.status != 429 or attempt >= self.max_retries:
+                        if response.status >= 400:
+                            raise JiraAPIError(response.status, await response.text())
+                        return await response.json(loads=orjson.loads)
+                    delay = self._retry_delay(response, attempt)
+
+            attempt += 1
+            logger.warning(
+                f"Rate limited by Jira on {url}; retrying in {delay:.1f}s "
+                f"(attempt {attempt}/{self.max_retries})"
+            )
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _retry_delay(response: aiohttp.ClientResponse, attempt: int) -> float:
+        """Get the delay before retrying a rate-limited request.
+
+        Args:
+            response: The HTTP 429 response
+            attempt: Number of retries already made
 
-            async with session.request(
-                method, url, params=params, json=data
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
+        Returns:
+            Seconds to wait, from ``Retry-After`` or exponential backoff
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                # HTTP-date values are rare from Jira; fall back to backoff
+                pass
+        # int.__pow__ is typed as Any for int exponents, so narrow it here
+        return RETRY_BACKOFF_SECONDS * float(2**attempt)
 
     async def get_issue(self, issue_key: str) -> JiraIssue:
         """Get a single issue by key.
 
+        Results are cached per client instance, so repeated lookups of the
+        same key do not hit the API again.
+
         Args:
             issue_key: Issue key (e.g., 'PROJ-123')
 
         Returns:
             JiraIssue object
         """
-        data = await self._make_request("GET", f"issue/{issue_key}")
-        return JiraIssue(**data)
+        issue = self._issue_cache.get(issue_key)
+        if issue is None:
+            data = await self._make_request("GET", f"issue/{issue_key}")
+            issue = JiraIssue(**data)
+            self._issue_cache[issue_key] = issue
+        else:
+            logger.debug(f"Using cached issue {issue_key}")
+        return issue
+
+    async def get_issues(
+        self,
+        issue_keys: List[str],
+        fields: Optional[List[str]] = None,
+        chunk_size: int = 100,
+    ) -> List[JiraIssue]:
+        """Get several issues by key with batched JQL searches.
 
-    async def search_issues(
+        Keys are looked up with ``key in (...)`` queries of up to
+        ``chunk_size`` keys each, and the chunks are fetched concurrently.
+        Jira rejects a whole query with HTTP 400 when one of its keys is
+        invalid or does not exist, so such a chunk is fetched again key by
+        key. Keys that cannot be fetched are logged and left out.
+
+        Args:
+            issue_keys: Issue keys (e.g., ['PROJ-123', 'PROJ-124'])
+            fields: List of fields to return (defaults to DEFAULT_ISSUE_FIELDS)
+            chunk_size: Maximum number of keys per search request
+
+        Returns:
+            List of the issues found, in the order of ``issue_keys``
+        """
+        unique_keys = list(dict.fromkeys(issue_keys))
+        if not unique_keys:
+            return []
+
+        chunks = [
+            unique_keys[i : i + chunk_size]
+            for i in range(0, len(unique_keys), chunk_size)
+        ]
+        logger.info(
+            f"Fetching {len(unique_keys)} issues in {len(chunks)} batched requests"
+        )
+
+        results = await asyncio.gather(
+            *(
+                self._get_issue_chunk(chunk, fields or DEFAULT_ISSUE_FIELDS)
+                for chunk in chunks
+            )
+        )
+
+        issues_by_key = {issue.key: issue for issues in results for issue in issues}
+        missing = [key for key in unique_keys if key not in issues_by_key]
+        if missing:
+            logger.warning(f"Issues not found: {', '.join(missing)}")
+        return [issues_by_key[key] for key in issue_keys if key in issues_by_key]
+
+    async def _get_issue_chunk(
+        self, issue_keys: List[str], fields: List[str]
+    ) -> List[JiraIssue]:
+        """Search for a chunk of issue keys, falling back to one GET per key.
+
+        Args:
+            issue_keys: Issue keys to search for in one query
+            fields: List of fields to return
+
+        Returns:
+            List of the issues found
+        """
+        try:
+            return await self._search_all_issues(
+                f"key in ({', '.join(issue_keys)})",
+                fields=fields,
+                batch_size=len(issue_keys),
+            )
+        except JiraAPIError as e:
+            if e.status != 400:
+                raise
+            logger.debug(f"Batched key search rejected, fetching keys singly: {e}")
+
+        issues = await asyncio.gather(
+            *(self._get_issue_or_none(key) for key in issue_keys)
+        )
+        return [issue for issue in issues if issue is not None]
+
+    async def _get_issue_or_none(self, issue_key: str) -> Optional[JiraIssue]:
+        """Get a single issue by key, or None if Jira rejects the key.
+
+        Args:
+            issue_key: Issue key (e.g., 'PROJ-123')
+
+        Returns:
+            JiraIssue object, or None for a missing or invalid key
+        """
+        try:
+            return await self.get_issue(issue_key)
+        except JiraAPIError as e:
+            if e.status not in (400, 404):
+                raise
+            return None
+
+    def invalidate_issue(self, issue_key: Optional[str] = None) -> None:
+        """Drop cached issue data.
+
+        Args:
+            issue_key: Issue key to invalidate, or None to clear the whole cache
+        """
+        if issue_key is None:
+            self._issue_cache.clear()
+        else:
+            self._issue_cache.pop(issue_key, None)
+
+    async def search_issues_raw(
         self,
         jql: str,
         fields: Optional[List[str]] = None,
         expand: Optional[List[str]] = None,
         start_at: int = 0,
-        max_results: int = 100,
-    ) -> JiraSearchResult:
-        """Search for issues using JQL.
+        max_results: int = DEFAULT_BATCH_SIZE,
+    ) -> Dict:
+        """Search for issues using JQL without model validation.
 
         Args:
             jql: JQL query string
@@ -133,7 +424,7 @@ class JiraClient:
             max_results: Maximum results to return
 
         Returns:
-            JiraSearchResult object
+            Search response JSON as returned by Jira
         """
         params = {
             "jql": jql,
@@ -147,48 +438,166 @@ class JiraClient:
         if expand:
             params["expand"] = ",".join(expand)
 
-        data = await self._make_request("GET", "search", params=params)
+        return await self._make_request("GET", "search", params=params)
+
+    async def search_issues(
+        self,
+        jql: str,
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+        start_at: int = 0,
+        max_results: int = DEFAULT_BATCH_SIZE,
+    ) -> JiraSearchResult:
+        """Search for issues using JQL.
+
+        Args:
+            jql: JQL query string
+            fields: List of fields to return
+            expand: List of fields to expand
+            start_at: Starting index for pagination
+            max_results: Maximum results to return
+
+        Returns:
+            JiraSearchResult object
+        """
+        data = await self.search_issues_raw(
+            jql,
+            fields=fields,
+            expand=expand,
+            start_at=start_at,
+            max_results=max_results,
+        )
         return JiraSearchResult(**data)
 
-    async def get_epic_issues(
-        self, epic_key: str, fields: Optional[List[str]] = None
+    async def _search_all_issues_raw(
+        self,
+        jql: str,
+        fields: Optional[List[str]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> List[Dict]:
+        """Fetch every page of a JQL search as raw issue JSON.
+
+        The first page is fetched to learn the total result count, then the
+        remaining pages are requested concurrently (still rate limited by the
+        throttler).
+
+        Args:
+            jql: JQL query string
+            fields: List of fields to return
+            batch_size: Requested page size for each search request
+
+        Returns:
+            List of issue dictionaries in result order
+        """
+        first_page = await self.search_issues_raw(
+            jql=jql,
+            fields=fields,
+            start_at=0,
+            max_results=batch_size,
+        )
+        issues = list(first_page["issues"])
+        total = first_page["total"]
+
+        # Jira silently caps maxResults, so page by what it actually returned
+        page_size = batch_size
+        if issues and len(issues) < batch_size and total > len(issues):
+            logger.warning(
+                f"Requested {batch_size} results per page but Jira returned "
+                f"{len(issues)}; using {len(issues)} as the page size"
+            )
+            page_size = len(issues)
+
+        offsets = range(page_size, total, page_size)
+        if offsets:
+            logger.info(f"Fetching {len(offsets)} more pages of {total} results...")
+            pages = await asyncio.gather(
+                *(
+                    self.search_issues_raw(
+                        jql=jql,
+                        fields=fields,
+                        start_at=offset,
+                        max_results=page_size,
+                    )
+                    for offset in offsets
+                )
+            )
+            for page in pages:
+                issues.extend(page["issues"])
+
+        return issues
+
+    async def _search_all_issues(
+        self,
+        jql: str,
+        fields: Optional[List[str]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
     ) -> List[JiraIssue]:
-        """Get all issues in an epic.
+        """Fetch every page of a JQL search.
 
         Args:
-            epic_key: Epic key (e.g., 'PROJ-123')
+            jql: JQL query string
             fields: List of fields to return
+            batch_size: Requested page size for each search request
 
         Returns:
-            List of JiraIssue objects
+            List of JiraIssue objects in result order
+        """
+        issues = await self._search_all_issues_raw(
+            jql, fields=fields, batch_size=batch_size
+        )
+        return _ISSUE_LIST_ADAPTER.validate_python(issues)
+
+    async def get_epic_issues_raw(
+        self,
+        epic_key: str,
+        fields: Optional[List[str]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> List[Dict]:
+        """Get all issues in an epic as raw Jira JSON.
+
+        Use this when only dictionaries are needed, to skip model validation.
+
+        Args:
+            epic_key: Epic key (e.g., 'PROJ-123')
+            fields: List of fields to return (defaults to DEFAULT_ISSUE_FIELDS)
+            batch_size: Number of issues to request per search page
+
+        Returns:
+            List of issue dictionaries
         """
         # Check both Epic Link (legacy) and Parent (modern) fields
         jql = f'("Epic Link" = {epic_key} OR parent = {epic_key})'
-        issues = []
-        start_at = 0
-        max_results = 100
 
         logger.info(f"Fetching issues for epic {epic_key}")
         logger.info(f"JQL Query: {jql}")
 
-        while True:
-            result = await self.search_issues(
-                jql=jql,
-                fields=fields,
-                start_at=start_at,
-                max_results=max_results,
-            )
+        issues = await self._search_all_issues_raw(
+            jql, fields=fields or DEFAULT_ISSUE_FIELDS, batch_size=batch_size
+        )
 
-            issues.extend(result.issues)
+        logger.info(f"Total issues found: {len(issues)}")
+        return issues
 
-            if len(result.issues) < max_results:
-                break
+    async def get_epic_issues(
+        self,
+        epic_key: str,
+        fields: Optional[List[str]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> List[JiraIssue]:
+        """Get all issues in an epic.
 
-            start_at += max_results
-            logger.info(f"Fetched {len(issues)} issues so far...")
+        Args:
+            epic_key: Epic key (e.g., 'PROJ-123')
+            fields: List of fields to return (defaults to DEFAULT_ISSUE_FIELDS)
+            batch_size: Number of issues to request per search page
 
-        logger.info(f"Total issues found: {len(issues)}")
-        return issues
+        Returns:
+            List of JiraIssue objects
+        """
+        issues = await self.get_epic_issues_raw(
+            epic_key, fields=fields, batch_size=batch_size
+        )
+        return _ISSUE_LIST_ADAPTER.validate_python(issues)
 
     async def get_epic_info(self, epic_key: str) -> JiraIssue:
         """Get epic information.
@@ -201,43 +610,118 @@ class JiraClient:
         """
         return await self.get_issue(epic_key)
 
-    async def get_story_subtasks(
-        self, story_key: str, fields: Optional[List[str]] = None
-    ) -> List[JiraIssue]:
-        """Get all sub-tasks of a story.
+    async def get_story_subtasks_raw(
+        self,
+        story_key: str,
+        fields: Optional[List[str]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> List[Dict]:
+        """Get all sub-tasks of a story as raw Jira JSON.
+
+        Use this when only dictionaries are needed, to skip model validation.
 
         Args:
             story_key: Story key (e.g., 'PROJ-123')
-            fields: List of fields to return
+            fields: List of fields to return (defaults to DEFAULT_ISSUE_FIELDS)
+            batch_size: Number of sub-tasks to request per search page
 
         Returns:
-            List of JiraIssue objects for sub-tasks
+            List of sub-task dictionaries
         """
         jql = f"parent = {story_key}"
-        issues = []
-        start_at = 0
-        max_results = 100
 
         logger.info(f"Fetching sub-tasks for story {story_key}")
 
-        while True:
-            result = await self.search_issues(
-                jql=jql,
-                fields=fields,
-                start_at=start_at,
-                max_results=max_results,
-            )
+        issues = await self._search_all_issues_raw(
+            jql, fields=fields or DEFAULT_ISSUE_FIELDS, batch_size=batch_size
+        )
+
+        logger.info(f"Total sub-tasks found: {len(issues)}")
+        return issues
+
+    async def get_story_subtasks(
+        self,
+        story_key: str,
+        fields: Optional[List[str]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> List[JiraIssue]:
+        """Get all sub-tasks of a story.
+
+        Args:
+            story_key: Story key (e.g., 'PROJ-123')
+            fields: List of fields to return (defaults to DEFAULT_ISSUE_FIELDS)
+            batch_size: Number of sub-tasks to request per search page
 
-            issues.extend(result.issues)
+        Returns:
+            List of JiraIssue objects for sub-tasks
+        """
+        issues = await self.get_story_subtasks_raw(
+            story_key, fields=fields, batch_size=batch_size
+        )
+        return _ISSUE_LIST_ADAPTER.validate_python(issues)
 
-            if len(result.issues) < max_results:
-                break
+    async def get_subtasks_for_stories(
+        self,
+        story_keys: List[str],
+        fields: Optional[List[str]] = None,
+        chunk_size: int = 100,
+        concurrency: int = 8,
+    ) -> Dict[str, List[JiraIssue]]:
+        """Get the sub-tasks of several stories with batched JQL searches.
 
-            start_at += max_results
-            logger.info(f"Fetched {len(issues)} sub-tasks so far...")
+        Stories are looked up with ``parent in (...)`` queries of up to
+        ``chunk_size`` keys each, so N stories cost roughly N / chunk_size
+        searches instead of one search per story.
 
-        logger.info(f"Total sub-tasks found: {len(issues)}")
-        return issues
+        Args:
+            story_keys: Story keys (e.g., ['PROJ-123', 'PROJ-124'])
+            fields: List of fields to return (defaults to DEFAULT_ISSUE_FIELDS)
+            chunk_size: Maximum number of story keys per search request
+            concurrency: Maximum number of chunk searches in flight at once;
+                the result pages of one search are fetched without this limit
+
+        Returns:
+            Dictionary mapping each story key to its sub-tasks; stories
+            without sub-tasks map to an empty list
+        """
+        unique_keys = list(dict.fromkeys(story_keys))
+        if not unique_keys:
+            return {}
+
+        chunks = [
+            unique_keys[i : i + chunk_size]
+            for i in range(0, len(unique_keys), chunk_size)
+        ]
+        logger.info(
+            f"Fetching sub-tasks for {len(unique_keys)} stories in "
+            f"{len(chunks)} batched requests"
+        )
+
+        # The parent field tells us which story each sub-task belongs to
+        search_fields = list(fields or DEFAULT_ISSUE_FIELDS)
+        if "parent" not in search_fields:
+            search_fields.append("parent")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _search_chunk(chunk: List[str]) -> List[Dict]:
+            async with semaphore:
+                return await self._search_all_issues_raw(
+                    f"parent in ({', '.join(chunk)})", fields=search_fields
+                )
+
+        results = await asyncio.gather(*(_search_chunk(chunk) for chunk in chunks))
+
+        raw_by_story: Dict[str, List[Dict]] = {key: [] for key in unique_keys}
+        for issues in results:
+            for issue in issues:
+                parent = issue["fields"].get("parent") or {}
+                raw_by_story.setdefault(parent.get("key", ""), []).append(issue)
+
+        return {
+            key: _ISSUE_LIST_ADAPTER.validate_python(raw_by_story[key])
+            for key in unique_keys
+        }
 
     async def get_story_info(self, story_key: str) -> JiraIssue:
         """Get story information.
@@ -257,6 +741,7 @@ class JiraClient:
         parent_issue: Optional[str] = None,
         additional_jql: Optional[str] = None,
         fields: Optional[List[str]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
     ) -> List[JiraIssue]:
         """Get all issues from a project board with optional filters.
 
@@ -266,6 +751,7 @@ class JiraClient:
             parent_issue: Optional parent issue key/ID for filtering
             additional_jql: Additional JQL conditions
             fields: List of fields to return
+            batch_size: Number of issues to request per search page
 
         Returns:
             List of JiraIssue objects
@@ -285,28 +771,12 @@ class JiraClient:
         # Order by created date descending to get most recent first
         jql = " AND ".join(jql_parts) + " ORDER BY created DESC"
 
-        issues = []
-        start_at = 0
-        max_results = 100
-
         logger.info(f"Fetching board issues for project {project_key}")
         logger.info(f"JQL Query: {jql}")
 
-        while True:
-            result = await self.search_issues(
-                jql=jql,
-                fields=fields,
-                start_at=start_at,
-                max_results=max_results,
-            )
-
-            issues.extend(result.issues)
-
-            if len(result.issues) < max_results:
-                break
-
-            start_at += max_results
-            logger.info(f"Fetched {len(issues)} issues so far...")
+        issues = await self._search_all_issues(
+            jql, fields=fields, batch_size=batch_size
+        )
 
         logger.info(f"Total issues found: {len(issues)}")
         return issues
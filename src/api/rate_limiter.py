@@ -0,0 +1,68 @@
+"""Token-bucket rate limiting for async API clients."""
+
+import asyncio
+from types import TracebackType
+from typing import Optional, Type
+
+
+class AsyncRateLimiter:
+    """Token-bucket rate limiter for asyncio tasks.
+
+    Up to ``burst`` requests may start immediately; after that tokens refill
+    continuously at ``rate_limit`` per second. Acquiring is a few arithmetic
+    operations unless the bucket is empty, so it composes cheaply with
+    ``asyncio.gather`` fan-out.
+    """
+
+    def __init__(self, rate_limit: float, burst: Optional[int] = None):
+        """Initialize rate limiter.
+
+        Args:
+            rate_limit: Requests per second limit
+            burst: Maximum number of requests allowed back to back
+                (defaults to rate_limit)
+
+        Raises:
+            ValueError: If rate_limit is not positive or burst is below 1
+        """
+        if rate_limit <= 0:
+            raise ValueError("rate_limit must be positive")
+        # A bucket that cannot hold one whole token never lets a request start
+        if burst is not None and burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate_limit = rate_limit
+        self.capacity = float(burst if burst is not None else max(rate_limit, 1))
+        self._tokens = self.capacity
+        self._updated_at: Optional[float] = None
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last update."""
+        if self._updated_at is not None:
+            elapsed = now - self._updated_at
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_limit)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be made and consume one token."""
+        loop = asyncio.get_running_loop()
+        while True:
+            self._refill(loop.time())
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate_limit)
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        """Async context manager entry."""
+        await self.acquire()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        """Async context manager exit."""
+        return None
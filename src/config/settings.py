@@ -1,7 +1,7 @@
 """Configuration settings for the jirabot application."""
 
 import os
-from typing import Optional
+from functools import lru_cache
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -32,17 +32,12 @@ class Settings(BaseSettings):
 
 
 def get_settings() -> Settings:
-    """Get application settings."""
-    return Settings()
-
-
-# Global settings instance - will be initialized when first accessed
-_settings: Optional[Settings] = None
+    """Load a fresh Settings instance from the environment."""
+    # Required fields are filled from the environment, which mypy can't see
+    return Settings()  # type: ignore[call-arg]
 
 
+@lru_cache(maxsize=1)
 def settings() -> Settings:
-    """Get or create application settings."""
-    global _settings
-    if _settings is None:
-        _settings = get_settings()
-    return _settings
+    """Get application settings, loading them on first call."""
+    return get_settings()
@@ -1,32 +1,118 @@
 """CLI helper utilities for Jira download scripts."""
 
+import asyncio
 import logging
+import logging.handlers
 import sys
-from typing import Optional
+from typing import Any, Callable, Coroutine, Optional, TypeVar
 
 from ..config.settings import settings
 
+logger = logging.getLogger(__name__)
+
+
+_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Records buffered before a write to jirabot.log (errors flush immediately)
+_LOG_BUFFER_CAPACITY = 1024
+
+_logging_configured = False
+
+T = TypeVar("T")
+
 
 def setup_logging(verbose: bool = False) -> None:
     """Setup logging configuration.
 
+    Handlers are only installed on the first call; later calls just apply
+    the verbosity. File output is buffered and flushed at exit, on errors,
+    or whenever the buffer fills.
+
     Args:
         verbose: Whether to enable verbose logging
     """
-    # Configure logging (will be configured properly in main function)
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler("jirabot.log"),
-        ],
-    )
+    global _logging_configured
+    if not _logging_configured:
+        # The log file is not opened until the first record is flushed
+        file_handler = logging.FileHandler("jirabot.log", delay=True)
+        file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+        buffered_file_handler = logging.handlers.MemoryHandler(
+            capacity=_LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+        )
+
+        # Configure logging (will be configured properly in main function)
+        logging.basicConfig(
+            level=logging.INFO,
+            format=_LOG_FORMAT,
+            handlers=[
+                logging.StreamHandler(sys.stdout),
+                buffered_file_handler,
+            ],
+        )
+        _logging_configured = True
 
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
 
+def _load_uvloop() -> Optional[Any]:
+    """Import uvloop if it is installed and supported on this platform."""
+    if sys.platform == "win32":
+        return None
+
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop
+
+
+def install_event_loop() -> bool:
+    """Install uvloop as the asyncio event loop policy when available.
+
+    uvloop is an optional speedup; without it (or on Windows) the default
+    asyncio event loop is used.
+
+    Returns:
+        True if uvloop was installed, False otherwise
+    """
+    uvloop = _load_uvloop()
+    if uvloop is None:
+        return False
+
+    uvloop.install()
+    logger.debug("Using uvloop event loop")
+    return True
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on a new event loop.
+
+    On Python 3.11+ this uses ``asyncio.Runner`` with a uvloop loop factory
+    when uvloop is available, so no global event loop policy is changed.
+    Older Pythons install uvloop as the policy and use ``asyncio.run``.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    if sys.version_info >= (3, 11):
+        uvloop = _load_uvloop()
+        loop_factory: Optional[Callable[[], asyncio.AbstractEventLoop]] = None
+        if uvloop is not None:
+            loop_factory = uvloop.new_event_loop
+            logger.debug("Using uvloop event loop")
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            return runner.run(coro)
+    else:
+        install_event_loop()
+        return asyncio.run(coro)
+
+
 def validate_settings(verbose: bool = False) -> None:
     """Validate required settings and configure logging.
 
@@ -36,19 +122,20 @@ def validate_settings(verbose: bool = False) -> None:
     Raises:
         SystemExit: If settings are invalid
     """
-    logger = logging.getLogger(__name__)
-
     try:
-        if not settings().jira_url:
+        app_settings = settings()
+        if not app_settings.jira_url:
             raise ValueError("JIRA_URL environment variable is required")
-        if not settings().jira_username:
+        if not app_settings.jira_username:
             raise ValueError("JIRA_USERNAME environment variable is required")
-        if not settings().jira_api_token:
+        if not app_settings.jira_api_token:
             raise ValueError("JIRA_API_TOKEN environment variable is required")
 
         # Configure logging level from settings
         if not verbose:
-            logging.getLogger().setLevel(getattr(logging, settings().log_level.upper()))
+            logging.getLogger().setLevel(
+                getattr(logging, app_settings.log_level.upper())
+            )
 
     except Exception as e:
         logger.error(f"Configuration error: {str(e)}")
@@ -95,6 +182,5 @@ def handle_download_error(error: Exception, item_type: str) -> None:
         error: Exception that occurred
         item_type: Type of item being downloaded
     """
-    logger = logging.getLogger(__name__)
     logger.error(f"Failed to download {item_type.lower()}: {str(error)}")
     sys.exit(1)
@@ -1,19 +1,32 @@
 """File utility functions for the jirabot application."""
 
+import io
 import json
 import os
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, Iterable, List, Union
 
 import logging
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# Buffer size for text output; large enough that a whole rendered Markdown
+# report reaches the OS in a handful of write() calls
+_WRITE_BUFFER_SIZE = 1 << 20
+
 
+@lru_cache(maxsize=128)
 def ensure_directory_exists(directory: str) -> None:
     """Ensure that a directory exists, creating it if necessary.
 
+    Each directory is only created once per process; call
+    ``ensure_directory_exists.cache_clear()`` if directories may be removed
+    while the process runs.
+
     Args:
         directory: Directory path to create
     """
@@ -24,6 +37,11 @@ def ensure_directory_exists(directory: str) -> None:
 def save_json(data: Any, file_path: str, indent: int = 2) -> None:
     """Save data to a JSON file with proper formatting.
 
+    The default indent of 2 is encoded with orjson, which writes the same
+    layout as the stdlib encoder with two differences: datetimes are written
+    in ISO 8601 format (2024-01-01T00:00:00) and NaN and infinities are
+    written as null. Other indent levels use the stdlib encoder unchanged.
+
     Args:
         data: Data to save (must be JSON serializable)
         file_path: Path to save the file
@@ -34,12 +52,40 @@ def save_json(data: Any, file_path: str, indent: int = 2) -> None:
     if directory:
         ensure_directory_exists(directory)
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, ensure_ascii=False, default=str)
+    if indent == 2:
+        with open(file_path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    data,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                )
+            )
+    else:
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False, default=str)
 
     logger.info(f"Saved JSON data to {file_path}")
 
 
+def save_text(content: Union[str, Iterable[str]], file_path: str) -> None:
+    """Save text content to a UTF-8 encoded file.
+
+    Args:
+        content: Text to write, or an iterable of chunks to stream to the file
+        file_path: Path to save the file
+    """
+    with open(
+        file_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE
+    ) as f:
+        if isinstance(content, str):
+            f.write(content)
+        else:
+            f.writelines(content)
+
+    logger.debug(f"Saved text data to {file_path}")
+
+
 def load_json(file_path: str) -> Any:
     """Load data from a JSON file.
 
@@ -53,8 +99,14 @@ def load_json(file_path: str) -> Any:
         FileNotFoundError: If the file doesn't exist
         json.JSONDecodeError: If the file contains invalid JSON
     """
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(file_path, "rb") as f:
+        raw = f.read()
+
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # The stdlib encoder writes NaN and Infinity, which orjson rejects
+        data = json.loads(raw)
 
     logger.debug(f"Loaded JSON data from {file_path}")
     return data
@@ -86,6 +138,10 @@ def get_file_size(file_path: str) -> int:
     return os.path.getsize(file_path)
 
 
+# Units above bytes, indexed by (bit_length - 1) // 10 - 1
+_SIZE_UNITS = (("KB", 1024), ("MB", 1024 * 1024), ("GB", 1024 * 1024 * 1024))
+
+
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human readable format.
 
@@ -97,20 +153,17 @@ def format_file_size(size_bytes: int) -> str:
     """
     if size_bytes < 1024:
         return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+    # Every 10 bits is one 1024x step; anything past GB is still shown in GB
+    unit, divisor = _SIZE_UNITS[min((size_bytes.bit_length() - 1) // 10, 3) - 1]
+    return f"{size_bytes / divisor:.1f} {unit}"
 
 
-def extract_text_from_adf(content: Union[str, Dict[str, Any], None]) -> str:
+def extract_text_from_adf(content: Any) -> str:
     """
     Extract plain text from Atlassian Document Format (ADF) content.
 
     Args:
-        content: ADF content or plain string
+        content: ADF document, plain string, or any other value (stringified)
 
     Returns:
         Plain text string
@@ -118,35 +171,50 @@ def extract_text_from_adf(content: Union[str, Dict[str, Any], None]) -> str:
     if content is None:
         return ""
 
-    if isinstance(content, str):
-        return content
-
-    if not isinstance(content, dict):
-        return str(content)
+    # Exact dict is the common ADF case; only other types need isinstance checks
+    if type(content) is not dict:
+        if isinstance(content, str):
+            return content
+        if not isinstance(content, dict):
+            return str(content)
 
     # Handle ADF format
     if content.get("type") == "doc" and "content" in content:
-        text_parts = []
-        _extract_text_recursive(content["content"], text_parts)
-        return " ".join(text_parts).strip()
+        return _extract_text_iterative(content["content"])
 
     return str(content)
 
 
-def _extract_text_recursive(
-    content: List[Dict[str, Any]], text_parts: List[str]
-) -> None:
+def _extract_text_iterative(content: List[Dict[str, Any]]) -> str:
     """
-    Recursively extract text from ADF content structure.
+    Extract space-separated text from an ADF content array.
+
+    Nodes are walked depth-first in document order with an explicit stack
+    of iterators, writing text straight into a buffer.
 
     Args:
         content: ADF content array
-        text_parts: List to append text parts to
+
+    Returns:
+        Plain text string
     """
-    for item in content:
-        if item.get("type") == "text" and "text" in item:
-            text_parts.append(item["text"])
-        elif item.get("type") == "hardBreak":
-            text_parts.append("\n")
-        elif "content" in item:
-            _extract_text_recursive(item["content"], text_parts)
+    buffer = io.StringIO()
+    separator = ""
+    stack = [iter(content)]
+    while stack:
+        for item in stack[-1]:
+            node_type = item.get("type")
+            if node_type == "text" and "text" in item:
+                buffer.write(separator)
+                buffer.write(item["text"])
+                separator = " "
+            elif node_type == "hardBreak":
+                buffer.write(separator)
+                buffer.write("\n")
+                separator = " "
+            elif "content" in item:
+                stack.append(iter(item["content"]))
+                break
+        else:
+            stack.pop()
+    return buffer.getvalue().strip()
@@ -2,12 +2,61 @@
 
 import re
 from datetime import datetime
-from typing import Dict, List, Optional
-
-
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Optional, cast
+
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:  # Optional C parser; fall back to datetime.fromisoformat
+    _parse_datetime = None
+
+# Matches Jira ticket references such as PROJ-123
+_TICKET_RE = re.compile(r"\b([A-Z][A-Z0-9]*-\d+)\b")
+
+# Emoji lookups used for every rendered issue row
+_STATUS_EMOJI = {
+    "To Do": "📋",
+    "Backlog": "📝",
+    "In Progress": "🔄",
+    "In Review": "👀",
+    "Done": "✅",
+    "Closed": "🔒",
+    "Open": "🔓",
+}
+
+_TYPE_EMOJI = {
+    "Task": "📋",
+    "Story": "📖",
+    "Bug": "🐛",
+    "Epic": "🎯",
+    "Sub-task": "📄",
+}
+
+_PRIORITY_EMOJI = {
+    "Highest": "🔴",
+    "High": "🟠",
+    "Normal": "🟡",
+    "Low": "🟢",
+    "Lowest": "🔵",
+}
+
+
+def _parse_iso_datetime(date_str: str) -> datetime:
+    """Parse an ISO 8601 string, using ciso8601 when it is installed."""
+    if _parse_datetime is not None:
+        try:
+            return cast(datetime, _parse_datetime(date_str))
+        except ValueError:
+            pass
+    return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+
+
+@lru_cache(maxsize=4096)
 def format_date(date_str: Optional[str]) -> str:
     """Format date string for better readability.
 
+    Results are cached, since the same timestamps recur across an export.
+
     Args:
         date_str: ISO date string or None
 
@@ -18,8 +67,12 @@ def format_date(date_str: Optional[str]) -> str:
         return "Not set"
     try:
         # Parse the datetime string and format it nicely
-        dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        return dt.strftime("%Y-%m-%d %H:%M")
+        dt = _parse_iso_datetime(date_str)
+        # Fixed, locale-independent format, so skip strftime
+        return (
+            f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+            f"{dt.hour:02d}:{dt.minute:02d}"
+        )
     except:
         return date_str
 
@@ -33,16 +86,7 @@ def get_issue_status_emoji(status_name: str) -> str:
     Returns:
         Emoji string for the status
     """
-    status_map = {
-        "To Do": "📋",
-        "Backlog": "📝",
-        "In Progress": "🔄",
-        "In Review": "👀",
-        "Done": "✅",
-        "Closed": "🔒",
-        "Open": "🔓",
-    }
-    return status_map.get(status_name, "📌")
+    return _STATUS_EMOJI.get(status_name, "📌")
 
 
 def get_issue_type_emoji(issue_type: str) -> str:
@@ -54,14 +98,7 @@ def get_issue_type_emoji(issue_type: str) -> str:
     Returns:
         Emoji string for the issue type
     """
-    type_map = {
-        "Task": "📋",
-        "Story": "📖",
-        "Bug": "🐛",
-        "Epic": "🎯",
-        "Sub-task": "📄",
-    }
-    return type_map.get(issue_type, "📄")
+    return _TYPE_EMOJI.get(issue_type, "📄")
 
 
 def get_priority_emoji(priority: Optional[str]) -> str:
@@ -75,14 +112,23 @@ def get_priority_emoji(priority: Optional[str]) -> str:
     """
     if not priority:
         return "⚪"
-    priority_map = {
-        "Highest": "🔴",
-        "High": "🟠",
-        "Normal": "🟡",
-        "Low": "🟢",
-        "Lowest": "🔵",
-    }
-    return priority_map.get(priority, "⚪")
+    return _PRIORITY_EMOJI.get(priority, "⚪")
+
+
+@lru_cache(maxsize=None)
+def make_ticket_linker(jira_base_url: str) -> Callable[[str], str]:
+    """Build a function that links JIRA ticket references for one Jira instance.
+
+    The replacement template is built once per base URL and reused for every
+    line of an export.
+
+    Args:
+        jira_base_url: Base URL for Jira instance
+
+    Returns:
+        Function taking text and returning it with ticket references linked
+    """
+    return partial(_TICKET_RE.sub, rf"[\1]({jira_base_url}/browse/\1)")
 
 
 def add_ticket_links(
@@ -97,12 +143,7 @@ def add_ticket_links(
     Returns:
         Text with ticket references converted to markdown links
     """
-    ticket_pattern = r"\b([A-Z][A-Z0-9]*-\d+)\b"
-    return re.sub(
-        ticket_pattern,
-        rf"[\1]({jira_base_url}/browse/\1)",
-        text,
-    )
+    return make_ticket_linker(jira_base_url)(text)
 
 
 def format_issue_details_table(
@@ -120,16 +161,24 @@ def format_issue_details_table(
     Returns:
         List of markdown table rows
     """
-    status_emoji = get_issue_status_emoji(fields["status"]["name"])
-    priority_emoji = get_priority_emoji(fields.get("priority", {}).get("name"))
+    status_name = fields["status"]["name"]
+    priority = fields.get("priority")
+    priority_name = priority.get("name") if priority else None
+    assignee = fields.get("assignee")
+    assignee_name = (
+        assignee.get("display_name", "Unassigned") if assignee else "Unassigned"
+    )
+    reporter = fields.get("reporter")
+    reporter_name = reporter.get("display_name", "Unknown") if reporter else "Unknown"
 
     rows = [
         "| Field | Value |",
         "|-------|-------|",
-        f"| **Priority** | {priority_emoji} {fields.get('priority', {}).get('name', 'None')} |",
-        f"| **Status** | {status_emoji} {fields['status']['name']} |",
-        f"| **Assignee** | {fields.get('assignee', {}).get('display_name', 'Unassigned') if fields.get('assignee') else 'Unassigned'} |",
-        f"| **Reporter** | {fields.get('reporter', {}).get('display_name', 'Unknown') if fields.get('reporter') else 'Unknown'} |",
+        f"| **Priority** | {get_priority_emoji(priority_name)} "
+        f"{'None' if priority_name is None else priority_name} |",
+        f"| **Status** | {get_issue_status_emoji(status_name)} {status_name} |",
+        f"| **Assignee** | {assignee_name} |",
+        f"| **Reporter** | {reporter_name} |",
         f"| **Created** | {format_date(fields.get('created'))} |",
         f"| **Updated** | {format_date(fields.get('updated'))} |",
     ]
@@ -160,13 +209,14 @@ def format_description_blockquote(
     if not description_text or not description_text.strip():
         return ["> No description provided"]
 
+    link_tickets = make_ticket_linker(jira_base_url)
     lines = []
     description_lines = description_text.strip().split("\n")
 
     for line in description_lines:
-        if line.strip():
-            linked_line = add_ticket_links(line.strip(), jira_base_url)
-            lines.append(f"> {linked_line}")
+        line = line.strip()
+        if line:
+            lines.append(f"> {link_tickets(line)}")
         else:
             lines.append(">")
 
@@ -1,8 +1,12 @@
 """Markdown generation utilities for Jira exports."""
 
 from collections import defaultdict
-from typing import Dict, List, Optional
+from heapq import nlargest
+from itertools import chain
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from .file_utils import extract_text_from_adf
 from .jira_formatters import (
     format_date,
     get_issue_status_emoji,
@@ -12,65 +16,127 @@ from .jira_formatters import (
     format_description_blockquote,
 )
 
+# Parts of an issue the markdown never reads; skipping them keeps the dumped
+# dicts from duplicating the typed models (notably the raw ADF descriptions)
+_UNRENDERED_ISSUE_PARTS: Dict[str, Any] = {
+    "id": True,
+    "self": True,
+    "fields": {
+        "description",
+        "creator",
+        "project",
+        "resolved",
+        "components",
+        "fix_versions",
+        "affects_versions",
+        "epic_link",
+        "sprint",
+    },
+}
+
+
+def issues_to_readable_dicts(issues: List[Any]) -> List[Dict[str, Any]]:
+    """Dump issues to dicts and add a plain-text ``description_text`` field.
+
+    Only the parts used for markdown generation are dumped; the ADF
+    description is read straight from the model.
 
-def generate_summary_statistics(
+    Args:
+        issues: JiraIssue objects to convert
+
+    Returns:
+        List of issue dictionaries ready for markdown generation
+    """
+    readable_issues = []
+    for issue in issues:
+        issue_data = issue.model_dump(exclude=_UNRENDERED_ISSUE_PARTS)
+        # Extract readable text from description
+        description = issue.fields.description
+        if description:
+            issue_data["fields"]["description_text"] = extract_text_from_adf(
+                description
+            )
+        readable_issues.append(issue_data)
+    return readable_issues
+
+
+def terminate_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Yield each markdown line with its trailing newline.
+
+    Args:
+        lines: Markdown lines without line terminators
+
+    Yields:
+        Each line followed by a newline
+    """
+    for line in lines:
+        yield f"{line}\n"
+
+
+def generate_stats_and_groups(
     issues: List[Dict],
     subtasks: Optional[Dict[str, List[Dict]]] = None,
-) -> Dict[str, Dict]:
-    """Generate summary statistics for issues and subtasks.
+) -> Tuple[Dict[str, Dict], Dict[str, List[Dict]]]:
+    """Generate summary statistics and group issues by type in a single pass.
 
     Args:
         issues: List of issue dictionaries
         subtasks: Optional dictionary mapping story keys to their subtasks
 
     Returns:
-        Dictionary containing statistics for issue types, statuses, priorities, and assignees
+        Tuple of (statistics dictionary, issues grouped by type name). The
+        groups only contain ``issues`` and are ordered by type name.
     """
     issue_types = defaultdict(int)
     statuses = defaultdict(int)
     priorities = defaultdict(int)
     assignees = defaultdict(int)
+    issues_by_type = defaultdict(list)
 
-    # Analyze main issues
-    for issue in issues:
+    # Main issues come first, so the leading type names line up with them
+    type_names = []
+    all_issues = chain(issues, *subtasks.values()) if subtasks else issues
+    for issue in all_issues:
         fields = issue["fields"]
-        issue_types[fields["issue_type"]["name"]] += 1
+        issue_type = fields["issue_type"]["name"]
+        type_names.append(issue_type)
+        issue_types[issue_type] += 1
         statuses[fields["status"]["name"]] += 1
+        priority = fields.get("priority")
+        priorities[priority["name"] if priority else "None"] += 1
+        assignee = fields.get("assignee")
+        assignees[assignee["display_name"] if assignee else "Unassigned"] += 1
+
+    for issue, issue_type in zip(issues, type_names):
+        issues_by_type[issue_type].append(issue)
 
-        if fields.get("priority"):
-            priorities[fields["priority"]["name"]] += 1
-        else:
-            priorities["None"] += 1
-
-        if fields.get("assignee"):
-            assignees[fields["assignee"]["display_name"]] += 1
-        else:
-            assignees["Unassigned"] += 1
-
-    # Analyze sub-tasks if provided
-    if subtasks:
-        for story_key, story_subtasks in subtasks.items():
-            for subtask in story_subtasks:
-                fields = subtask["fields"]
-                issue_types[fields["issue_type"]["name"]] += 1
-                statuses[fields["status"]["name"]] += 1
-
-                if fields.get("priority"):
-                    priorities[fields["priority"]["name"]] += 1
-                else:
-                    priorities["None"] += 1
-
-                if fields.get("assignee"):
-                    assignees[fields["assignee"]["display_name"]] += 1
-                else:
-                    assignees["Unassigned"] += 1
-
-    return {
+    stats = {
         "issue_types": dict(issue_types),
         "statuses": dict(statuses),
         "priorities": dict(priorities),
         "assignees": dict(assignees),
     }
+    groups = {
+        issue_type: issues_by_type[issue_type] for issue_type in sorted(issues_by_type)
+    }
+    return stats, groups
+
+
+def generate_summary_statistics(
+    issues: List[Dict],
+    subtasks: Optional[Dict[str, List[Dict]]] = None,
+) -> Dict[str, Dict]:
+    """Generate summary statistics for issues and subtasks.
+
+    Args:
+        issues: List of issue dictionaries
+        subtasks: Optional dictionary mapping story keys to their subtasks
+
+    Returns:
+        Dictionary containing statistics for issue types, statuses, priorities, and assignees
+    """
+    stats, _ = generate_stats_and_groups(issues, subtasks)
+    return stats
 
 
 def generate_statistics_markdown(stats: Dict[str, Dict]) -> List[str]:
@@ -107,9 +173,8 @@ def generate_statistics_markdown(stats: Dict[str, Dict]) -> List[str]:
 
     # Top Assignees
     md_lines.append("### Top Assignees")
-    sorted_assignees = sorted(
-        stats["assignees"].items(), key=lambda x: x[1], reverse=True
-    )[:10]
+    # Same order as a stable descending sort, without sorting every assignee
+    sorted_assignees = nlargest(10, stats["assignees"].items(), key=itemgetter(1))
     for assignee, count in sorted_assignees:
         md_lines.append(
             f"- **{assignee}**: {count} {'issue' if count == 1 else 'issues'}"
@@ -119,6 +184,22 @@ def generate_statistics_markdown(stats: Dict[str, Dict]) -> List[str]:
     return md_lines
 
 
+# Maps heading text to its anchor form: spaces become dashes, slashes are dropped
+_ANCHOR_TABLE = str.maketrans({" ": "-", "/": None})
+
+
+def heading_anchor(title: str) -> str:
+    """Convert a heading title to the anchor used in table of contents links.
+
+    Args:
+        title: Heading text
+
+    Returns:
+        Lower-cased anchor with spaces as dashes and slashes removed
+    """
+    return title.lower().translate(_ANCHOR_TABLE)
+
+
 def generate_table_of_contents(
     issue_types: List[str],
     include_summary: bool = True,
@@ -144,25 +225,27 @@ def generate_table_of_contents(
         md_lines.append("- [Summary Statistics](#📊-summary-statistics)")
 
     if include_main_section:
-        anchor = main_section_title.lower().replace(" ", "-")
-        md_lines.append(f"- [{main_section_title}](#🎫-{anchor})")
+        md_lines.append(
+            f"- [{main_section_title}](#🎫-{heading_anchor(main_section_title)})"
+        )
 
     # Group issues by type for TOC
     for issue_type in sorted(issue_types):
-        anchor = issue_type.lower().replace(" ", "-").replace("/", "")
-        md_lines.append(f"  - [{issue_type}](#🔸-{anchor})")
+        md_lines.append(f"  - [{issue_type}](#🔸-{heading_anchor(issue_type)})")
     md_lines.append("")
 
     return md_lines
 
 
-def generate_issue_section(
+def iter_issue_section(
     issue: Dict,
     jira_base_url: str = "https://mercari.atlassian.net",
     include_subtasks: bool = False,
     subtasks: Optional[List[Dict]] = None,
-) -> List[str]:
-    """Generate markdown section for a single issue.
+) -> Iterator[str]:
+    """Generate markdown for a single issue, one newline-terminated line at a time.
+
+    Lines are meant to be written straight to a file as they are produced.
 
     Args:
         issue: Issue dictionary
@@ -170,60 +253,58 @@ def generate_issue_section(
         include_subtasks: Whether to include subtasks section
         subtasks: List of subtask dictionaries
 
-    Returns:
-        List of markdown lines
+    Yields:
+        Markdown lines, each ending with a newline
     """
-    md_lines = []
     fields = issue["fields"]
+    key = issue["key"]
 
-    # Issue header with link
-    status_emoji = get_issue_status_emoji(fields["status"]["name"])
-    priority_emoji = get_priority_emoji(fields.get("priority", {}).get("name"))
-
-    md_lines.append(
-        f"#### {status_emoji} [{issue['key']}]({jira_base_url}/browse/{issue['key']}) - {fields['summary']}"
+    # Issue header with link, followed by the details table
+    yield (
+        f"#### {get_issue_status_emoji(fields['status']['name'])} "
+        f"[{key}]({jira_base_url}/browse/{key}) - {fields['summary']}\n"
     )
-    md_lines.append("")
-
-    # Issue details table
-    md_lines.extend(format_issue_details_table(fields))
-    md_lines.append("")
+    yield "\n"
+    yield from terminate_lines(format_issue_details_table(fields))
+    yield "\n"
 
     # Description with ticket linking
     if fields.get("description_text"):
-        md_lines.append("**Description:**")
-        md_lines.append("")
-        md_lines.extend(
+        yield "**Description:**\n"
+        yield "\n"
+        yield from terminate_lines(
             format_description_blockquote(fields["description_text"], jira_base_url)
         )
-        md_lines.append("")
+        yield "\n"
 
     # Add sub-tasks if requested and available
     if include_subtasks and subtasks:
-        md_lines.append("##### 📋 Sub-tasks")
-        md_lines.append("")
+        yield "##### 📋 Sub-tasks\n"
+        yield "\n"
 
         for subtask in subtasks:
             subtask_fields = subtask["fields"]
-            subtask_status_emoji = get_issue_status_emoji(
-                subtask_fields["status"]["name"]
-            )
-            subtask_priority_emoji = get_priority_emoji(
-                subtask_fields.get("priority", {}).get("name")
+            subtask_key = subtask["key"]
+            status_name = subtask_fields["status"]["name"]
+            status_emoji = get_issue_status_emoji(status_name)
+            priority = subtask_fields.get("priority")
+            priority_name = priority.get("name") if priority else None
+            assignee = subtask_fields.get("assignee")
+            assignee_name = (
+                assignee.get("display_name", "Unassigned") if assignee else "Unassigned"
             )
 
-            md_lines.append(
-                f"- {subtask_status_emoji} **[{subtask['key']}]({jira_base_url}/browse/{subtask['key']})** - {subtask_fields['summary']}"
-            )
-            md_lines.append(
-                f"  - **Priority:** {subtask_priority_emoji} {subtask_fields.get('priority', {}).get('name', 'None')}"
+            yield (
+                f"- {status_emoji} "
+                f"**[{subtask_key}]({jira_base_url}/browse/{subtask_key})**"
+                f" - {subtask_fields['summary']}\n"
             )
-            md_lines.append(
-                f"  - **Status:** {subtask_status_emoji} {subtask_fields['status']['name']}"
-            )
-            md_lines.append(
-                f"  - **Assignee:** {subtask_fields.get('assignee', {}).get('display_name', 'Unassigned') if subtask_fields.get('assignee') else 'Unassigned'}"
+            yield (
+                f"  - **Priority:** {get_priority_emoji(priority_name)} "
+                f"{'None' if priority_name is None else priority_name}\n"
             )
+            yield f"  - **Status:** {status_emoji} {status_name}\n"
+            yield f"  - **Assignee:** {assignee_name}\n"
 
             if subtask_fields.get("description_text"):
                 description = subtask_fields["description_text"].strip()
@@ -232,16 +313,37 @@ def generate_issue_section(
                     first_line = description.split("\n")[0]
                     if len(first_line) > 80:
                         first_line = first_line[:80] + "..."
-                    md_lines.append(f"  - **Description:** {first_line}")
+                    yield f"  - **Description:** {first_line}\n"
 
-            md_lines.append("")
+            yield "\n"
 
-        md_lines.append("")
+        yield "\n"
 
-    md_lines.append("---")
-    md_lines.append("")
+    yield "---\n"
+    yield "\n"
 
-    return md_lines
+
+def generate_issue_section(
+    issue: Dict,
+    jira_base_url: str = "https://mercari.atlassian.net",
+    include_subtasks: bool = False,
+    subtasks: Optional[List[Dict]] = None,
+) -> List[str]:
+    """Generate markdown section for a single issue.
+
+    Args:
+        issue: Issue dictionary
+        jira_base_url: Base URL for Jira instance
+        include_subtasks: Whether to include subtasks section
+        subtasks: List of subtask dictionaries
+
+    Returns:
+        List of markdown lines
+    """
+    return [
+        line[:-1]
+        for line in iter_issue_section(issue, jira_base_url, include_subtasks, subtasks)
+    ]
 
 
 def generate_export_footer(
@@ -267,20 +369,28 @@ def generate_export_footer(
     Returns:
         List of markdown lines
     """
-    md_lines = []
-    md_lines.append("## ℹ️ Export Information")
-    md_lines.append("")
-    md_lines.append(
-        f"- **Source {item_type}:** [{item_key}]({jira_base_url}/browse/{item_key})"
-    )
-    md_lines.append(f"- **Export Date:** {format_date(download_timestamp)}")
-
-    if item_type.lower() == "epic":
-        md_lines.append(f"- **Total Issues Exported:** {total_items}")
-        md_lines.append(f"- **Total Sub-tasks Exported:** {total_subtasks}")
-        md_lines.append(f"- **Generated by:** Jirabot Epic Exporter")
-    elif item_type.lower() == "story":
-        md_lines.append(f"- **Total Sub-tasks Exported:** {total_subtasks}")
-        md_lines.append(f"- **Generated by:** Jirabot Story Exporter")
+    md_lines = [
+        "## ℹ️ Export Information",
+        "",
+        f"- **Source {item_type}:** [{item_key}]({jira_base_url}/browse/{item_key})",
+        f"- **Export Date:** {format_date(download_timestamp)}",
+    ]
+
+    item_type_name = item_type.lower()
+    if item_type_name == "epic":
+        md_lines.extend(
+            (
+                f"- **Total Issues Exported:** {total_items}",
+                f"- **Total Sub-tasks Exported:** {total_subtasks}",
+                "- **Generated by:** Jirabot Epic Exporter",
+            )
+        )
+    elif item_type_name == "story":
+        md_lines.extend(
+            (
+                f"- **Total Sub-tasks Exported:** {total_subtasks}",
+                "- **Generated by:** Jirabot Story Exporter",
+            )
+        )
 
     return md_lines
@@ -0,0 +1,16 @@
+"""Shared pytest configuration for the test suite."""
+
+import pytest
+from pytest_asyncio import is_async_test
+
+
+def pytest_collection_modifyitems(items):
+    """Run every asyncio test on one session-wide event loop.
+
+    Sharing the loop avoids creating and closing a fresh event loop for each
+    async test.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
@@ -2,112 +2,96 @@
 """Unit tests for scripts.download_story_subtasks.py"""
 
 import asyncio
+import contextlib
+import copy
+import dataclasses
+import functools
+import io
 import pytest
-from unittest.mock import Mock, AsyncMock, patch, mock_open
+from unittest.mock import Mock, AsyncMock, MagicMock, patch, mock_open
 from datetime import datetime
 from pathlib import Path
 import json
+import re
 
+from src.api.jira_client import JiraAPIError
 from src.models.jira_models import StoryDownloadResult, JiraIssue, JiraIssueFields
 from scripts.download_story_subtasks import (
     create_markdown_from_story_data,
     download_story_subtasks,
+    iter_markdown_from_story_data,
     main,
 )
 
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
-class TestCreateMarkdownFromStoryData:
-    """Test cases for create_markdown_from_story_data function."""
 
-    @pytest.fixture
-    def sample_story_data(self):
-        """Sample story data for testing."""
-        return {
-            "story_key": "PROJ-123",
-            "story_summary": "Test Story Summary",
-            "total_subtasks": 2,
-            "download_timestamp": "2024-01-15T10:30:00",
-            "story_issue": {
-                "fields": {
-                    "summary": "Test Story Summary",
-                    "description_text": "This is a test story description",
-                    "status": {"name": "In Progress"},
-                    "priority": {"name": "High"},
-                    "assignee": {"display_name": "John Doe"},
-                    "reporter": {"display_name": "Jane Smith"},
-                    "created": "2024-01-01T09:00:00.000+0000",
-                    "updated": "2024-01-15T10:00:00.000+0000",
-                    "issue_type": {"name": "Story"},
-                }
-            },
-            "subtasks": [
-                {
-                    "key": "PROJ-124",
-                    "fields": {
-                        "summary": "Subtask 1",
-                        "description_text": "First subtask description",
-                        "status": {"name": "To Do"},
-                        "priority": {"name": "Medium"},
-                        "assignee": {"display_name": "Alice Johnson"},
-                        "reporter": {"display_name": "Bob Wilson"},
-                        "created": "2024-01-02T09:00:00.000+0000",
-                        "updated": "2024-01-15T09:30:00.000+0000",
-                        "issue_type": {"name": "Sub-task"},
-                    },
-                },
-                {
-                    "key": "PROJ-125",
-                    "fields": {
-                        "summary": "Subtask 2",
-                        "description_text": "Second subtask description",
-                        "status": {"name": "Done"},
-                        "priority": {"name": "Low"},
-                        "assignee": {"display_name": "Charlie Brown"},
-                        "reporter": {"display_name": "Diana Prince"},
-                        "created": "2024-01-03T09:00:00.000+0000",
-                        "updated": "2024-01-15T11:00:00.000+0000",
-                        "issue_type": {"name": "Sub-task"},
-                    },
-                },
-            ],
-        }
+@dataclasses.dataclass
+class _FakeResult:
+    """Plain stand-in for StoryDownloadResult where only attributes are read."""
 
-    def test_create_markdown_with_subtasks(self, sample_story_data):
-        """Test markdown generation with subtasks."""
-        result = create_markdown_from_story_data(sample_story_data)
+    __slots__ = ("story_key", "story_summary", "total_subtasks", "output_file")
+
+    story_key: str
+    story_summary: str
+    total_subtasks: int
+    output_file: str
+
+
+@functools.lru_cache(maxsize=1)
+def _load_sample_story():
+    """Parse the sample story fixture once; callers must not mutate it."""
+    return json.loads(
+        (FIXTURES_DIR / "sample_story.json").read_text(encoding="utf-8")
+    )
 
-        # Check title
-        assert (
-            "# Story: [PROJ-123](https://mercari.atlassian.net/browse/PROJ-123) - Test Story Summary"
-            in result
-        )
 
-        # Check basic information
-        assert "**Total Sub-tasks:** 2" in result
-        assert "**Download Date:**" in result
+# Markdown links to Jira issues, e.g. "[PROJ-123](https://host/browse/PROJ-123)"
+STORY_LINK_RE = re.compile(
+    r"\[(?P<key>PROJ-\d+)\]\((?P<base>https?://[^)]+)/browse/(?P=key)\)"
+)
 
-        # Check story information section
-        assert "## 📖 Story Information" in result
+# Markers the rendered sample story must contain, checked in one pass
+REQUIRED_MARKERS = (
+    # Title
+    "# Story: [PROJ-123](https://mercari.atlassian.net/browse/PROJ-123) - Test Story Summary",
+    # Basic information
+    "**Total Sub-tasks:** 2",
+    "**Download Date:**",
+    # Story information and description
+    "## 📖 Story Information",
+    "### 📝 Story Description",
+    "This is a test story description",
+    # Summary statistics and table of contents
+    "## 📊 Sub-tasks Summary Statistics",
+    "## 📋 Table of Contents",
+    # Sub-tasks section and details
+    "## 📋 All Sub-tasks",
+    "### 🔸 Sub-task",
+    "PROJ-124",
+    "Subtask 1",
+    "PROJ-125",
+    "Subtask 2",
+)
 
-        # Check story description
-        assert "### 📝 Story Description" in result
-        assert "This is a test story description" in result
 
-        # Check summary statistics
-        assert "## 📊 Sub-tasks Summary Statistics" in result
+class TestCreateMarkdownFromStoryData:
+    """Test cases for create_markdown_from_story_data function."""
 
-        # Check table of contents
-        assert "## 📋 Table of Contents" in result
+    @pytest.fixture
+    def sample_story_data(self):
+        """Sample story data for testing; a fresh copy per test."""
+        return copy.deepcopy(_load_sample_story())
 
-        # Check sub-tasks section
-        assert "## 📋 All Sub-tasks" in result
-        assert "### 🔸 Sub-task" in result
+    @pytest.fixture(scope="module")
+    def rendered_sample(self):
+        """Markdown for the sample story, rendered once per module."""
+        return create_markdown_from_story_data(_load_sample_story())
 
-        # Check subtask details
-        assert "PROJ-124" in result
-        assert "Subtask 1" in result
-        assert "PROJ-125" in result
-        assert "Subtask 2" in result
+    def test_create_markdown_with_subtasks(self, rendered_sample):
+        """Test markdown generation with subtasks."""
+        missing = [m for m in REQUIRED_MARKERS if m not in rendered_sample]
+        assert not missing, missing
 
     def test_create_markdown_no_subtasks(self, sample_story_data):
         """Test markdown generation without subtasks."""
@@ -134,7 +118,10 @@ class TestCreateMarkdownFromStoryData:
         custom_url = "https://mycompany.atlassian.net"
         result = create_markdown_from_story_data(sample_story_data, custom_url)
 
-        assert f"[PROJ-123]({custom_url}/browse/PROJ-123)" in result
+        links = list(STORY_LINK_RE.finditer(result))
+        assert links
+        assert links[0]["key"] == "PROJ-123"
+        assert {link["base"] for link in links} == {custom_url}
 
     def test_create_markdown_no_description(self, sample_story_data):
         """Test markdown generation when story has no description."""
@@ -145,13 +132,22 @@ class TestCreateMarkdownFromStoryData:
         # Should not have description section
         assert "### 📝 Story Description" not in result
 
+    def test_iter_markdown_streams_same_content(
+        self, sample_story_data, rendered_sample
+    ):
+        """Test that streamed chunks add up to the rendered markdown."""
+        chunks = list(iter_markdown_from_story_data(sample_story_data))
+
+        assert all(chunk.endswith("\n") for chunk in chunks)
+        assert "".join(chunks) == rendered_sample
+
 
 class TestDownloadStorySubtasks:
     """Test cases for download_story_subtasks function."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_jira_issue(self):
-        """Mock Jira issue object."""
+        """Mock Jira issue object, built once per module and never mutated."""
         return JiraIssue(
             id="123456",
             key="PROJ-123",
@@ -203,9 +199,9 @@ class TestDownloadStorySubtasks:
             ),
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_subtasks(self):
-        """Mock subtasks list."""
+        """Mock subtasks list, built once per module and never mutated."""
         return [
             JiraIssue(
                 id="123457",
@@ -262,143 +258,169 @@ class TestDownloadStorySubtasks:
             )
         ]
 
-    @pytest.mark.asyncio
-    async def test_download_story_subtasks_success(
-        self, mock_jira_issue, mock_subtasks, tmp_path
-    ):
-        """Test successful download of story and subtasks."""
-        with patch("scripts.download_story_subtasks.JiraClient") as mock_jira_client, patch(
-            "scripts.download_story_subtasks.ensure_directory_exists"
-        ) as mock_ensure_dir, patch(
-            "scripts.download_story_subtasks.get_file_size"
-        ) as mock_get_size, patch(
-            "scripts.download_story_subtasks.extract_text_from_adf"
-        ) as mock_extract_text, patch(
-            "builtins.open", mock_open()
-        ) as mock_file:
+    @pytest.fixture
+    def patched_jira(self, mock_jira_issue, mock_subtasks):
+        """Patch the Jira client and file helpers used by the download.
+
+        Yields the mocked client instance, preloaded with the story and its
+        sub-tasks, and a dict of the other patches keyed by patched name.
+        """
+        module = "scripts.download_story_subtasks"
+        with contextlib.ExitStack() as stack:
+            mock_jira_client = stack.enter_context(patch(f"{module}.JiraClient"))
+            patches = {
+                "ensure_directory_exists": stack.enter_context(
+                    patch(f"{module}.ensure_directory_exists")
+                ),
+                "get_file_size": stack.enter_context(
+                    patch(f"{module}.get_file_size", return_value=1024)
+                ),
+                "extract_text_from_adf": stack.enter_context(
+                    patch(
+                        "src.utils.markdown_generators.extract_text_from_adf",
+                        return_value="Extracted text",
+                    )
+                ),
+                "open": stack.enter_context(patch("builtins.open", mock_open())),
+            }
 
-            # Setup mocks
             mock_jira_instance = AsyncMock()
             mock_jira_client.return_value.__aenter__.return_value = mock_jira_instance
             mock_jira_instance.get_story_info.return_value = mock_jira_issue
             mock_jira_instance.get_story_subtasks.return_value = mock_subtasks
-            mock_get_size.return_value = 1024
-            mock_extract_text.return_value = "Extracted text"
+            yield mock_jira_instance, patches
+
+    @pytest.mark.asyncio
+    async def test_download_story_subtasks_success(
+        self, patched_jira, mock_jira_issue, mock_subtasks, tmp_path
+    ):
+        """Test successful download of story and subtasks."""
+        mock_jira_instance, patches = patched_jira
+
+        # Test the function
+        result = await download_story_subtasks(
+            story_key="PROJ-123",
+            output_dir=str(tmp_path),
+            output_filename="test_story.md",
+        )
 
-            # Test the function
+        # Verify result
+        assert isinstance(result, StoryDownloadResult)
+        assert result.story_key == "PROJ-123"
+        assert result.story_summary == "Test Story Summary"
+        assert result.total_subtasks == 1
+        assert result.story_issue == mock_jira_issue
+        assert result.subtasks == mock_subtasks
+        assert result.output_file == str(tmp_path / "test_story.md")
+
+        # Verify mocks were called
+        patches["ensure_directory_exists"].assert_called_once_with(str(tmp_path))
+        mock_jira_instance.get_story_info.assert_awaited_once_with("PROJ-123")
+        mock_jira_instance.get_story_subtasks.assert_awaited_once_with("PROJ-123")
+        patches["open"].assert_called_once()
+        assert patches["open"].call_args.kwargs.get("buffering") == 1024 * 1024
+
+    @pytest.mark.asyncio
+    async def test_download_story_subtasks_fetches_concurrently(
+        self, patched_jira, mock_jira_issue, mock_subtasks, tmp_path
+    ):
+        """Test that story info and sub-tasks are requested in one gather call."""
+        real_gather = asyncio.gather
+        with patch(
+            "scripts.download_story_subtasks.asyncio.gather", side_effect=real_gather
+        ) as mock_gather:
             result = await download_story_subtasks(
                 story_key="PROJ-123",
                 output_dir=str(tmp_path),
                 output_filename="test_story.md",
             )
 
-            # Verify result
-            assert isinstance(result, StoryDownloadResult)
-            assert result.story_key == "PROJ-123"
-            assert result.story_summary == "Test Story Summary"
-            assert result.total_subtasks == 1
-            assert result.story_issue == mock_jira_issue
-            assert result.subtasks == mock_subtasks
-            assert result.output_file == str(tmp_path / "test_story.md")
-
-            # Verify mocks were called
-            mock_ensure_dir.assert_called_once_with(str(tmp_path))
-            mock_jira_instance.get_story_info.assert_called_once_with("PROJ-123")
-            mock_jira_instance.get_story_subtasks.assert_called_once_with("PROJ-123")
-            mock_file.assert_called_once()
+        # Both Jira calls were scheduled together
+        mock_gather.assert_called_once()
+        assert len(mock_gather.call_args.args) == 2
+        assert result.story_issue == mock_jira_issue
+        assert result.subtasks == mock_subtasks
 
     @pytest.mark.asyncio
-    async def test_download_story_subtasks_default_params(
-        self, mock_jira_issue, mock_subtasks
+    async def test_download_story_subtasks_uses_search_results_directly(
+        self, patched_jira, mock_subtasks, tmp_path
     ):
+        """Test that sub-tasks are not re-fetched one by one after the search."""
+        mock_jira_instance, _ = patched_jira
+
+        result = await download_story_subtasks(
+            story_key="PROJ-123",
+            output_dir=str(tmp_path),
+            output_filename="test_story.md",
+        )
+
+        # The sub-task search already returns every rendered field
+        mock_jira_instance.get_issue.assert_not_awaited()
+        mock_jira_instance.get_issues.assert_not_awaited()
+        assert result.subtasks == mock_subtasks
+
+    @pytest.mark.asyncio
+    async def test_download_story_subtasks_default_params(self, patched_jira):
         """Test download with default parameters."""
-        with patch("scripts.download_story_subtasks.JiraClient") as mock_jira_client, patch(
-            "scripts.download_story_subtasks.ensure_directory_exists"
-        ) as mock_ensure_dir, patch(
-            "scripts.download_story_subtasks.get_file_size"
-        ) as mock_get_size, patch(
-            "scripts.download_story_subtasks.extract_text_from_adf"
-        ) as mock_extract_text, patch(
+        _, patches = patched_jira
+        with patch(
             "scripts.download_story_subtasks.settings"
         ) as mock_settings, patch(
             "scripts.download_story_subtasks.generate_timestamp_filename"
-        ) as mock_timestamp, patch(
-            "builtins.open", mock_open()
-        ) as mock_file:
-
-            # Setup mocks
-            mock_jira_instance = AsyncMock()
-            mock_jira_client.return_value.__aenter__.return_value = mock_jira_instance
-            mock_jira_instance.get_story_info.return_value = mock_jira_issue
-            mock_jira_instance.get_story_subtasks.return_value = mock_subtasks
-            mock_get_size.return_value = 1024
-            mock_extract_text.return_value = "Extracted text"
+        ) as mock_timestamp:
             mock_settings.return_value.output_dir = "./output"
             mock_timestamp.return_value = "story_PROJ-123_20240115_103000.json"
 
             # Test with default parameters
-            result = await download_story_subtasks("PROJ-123")
+            await download_story_subtasks("PROJ-123")
 
-            # Verify default settings were used
-            mock_settings.assert_called_once()
-            mock_ensure_dir.assert_called_once_with("./output")
-            mock_timestamp.assert_called_once_with("story_PROJ-123")
+        # Verify default settings were used
+        mock_settings.assert_called_once()
+        patches["ensure_directory_exists"].assert_called_once_with("./output")
+        mock_timestamp.assert_called_once_with("story_PROJ-123")
+        assert patches["open"].call_args.kwargs.get("buffering") == 1024 * 1024
 
     @pytest.mark.asyncio
-    async def test_download_story_subtasks_jira_error(
-        self, mock_jira_issue, mock_subtasks
-    ):
+    async def test_download_story_subtasks_jira_error(self, patched_jira):
         """Test error handling when Jira client fails."""
-        with patch("scripts.download_story_subtasks.JiraClient") as mock_jira_client, patch(
-            "scripts.download_story_subtasks.ensure_directory_exists"
-        ):
+        mock_jira_instance, _ = patched_jira
+        mock_jira_instance.get_story_info.side_effect = JiraAPIError(
+            500, "Jira API Error"
+        )
 
-            # Setup mock to raise exception
-            mock_jira_instance = AsyncMock()
-            mock_jira_client.return_value.__aenter__.return_value = mock_jira_instance
-            mock_jira_instance.get_story_info.side_effect = Exception("Jira API Error")
+        # Test that exception is raised
+        with pytest.raises(JiraAPIError) as exc_info:
+            await download_story_subtasks("PROJ-123")
 
-            # Test that exception is raised
-            with pytest.raises(Exception, match="Jira API Error"):
-                await download_story_subtasks("PROJ-123")
+        assert exc_info.value.status == 500
+        assert exc_info.value.msg == "Jira API Error"
 
     @pytest.mark.asyncio
-    async def test_download_story_subtasks_no_subtasks(self, mock_jira_issue, tmp_path):
+    async def test_download_story_subtasks_no_subtasks(self, patched_jira, tmp_path):
         """Test download when story has no subtasks."""
-        with patch("scripts.download_story_subtasks.JiraClient") as mock_jira_client, patch(
-            "scripts.download_story_subtasks.ensure_directory_exists"
-        ) as mock_ensure_dir, patch(
-            "scripts.download_story_subtasks.get_file_size"
-        ) as mock_get_size, patch(
-            "scripts.download_story_subtasks.extract_text_from_adf"
-        ) as mock_extract_text, patch(
-            "builtins.open", mock_open()
-        ) as mock_file:
-
-            # Setup mocks
-            mock_jira_instance = AsyncMock()
-            mock_jira_client.return_value.__aenter__.return_value = mock_jira_instance
-            mock_jira_instance.get_story_info.return_value = mock_jira_issue
-            mock_jira_instance.get_story_subtasks.return_value = []  # No subtasks
-            mock_get_size.return_value = 512
-            mock_extract_text.return_value = "Extracted text"
-
-            # Test the function
-            result = await download_story_subtasks(
-                story_key="PROJ-123",
-                output_dir=str(tmp_path),
-                output_filename="test_story.md",
-            )
+        mock_jira_instance, patches = patched_jira
+        mock_jira_instance.get_story_subtasks.return_value = []  # No subtasks
+        patches["get_file_size"].return_value = 512
+
+        # Test the function
+        result = await download_story_subtasks(
+            story_key="PROJ-123",
+            output_dir=str(tmp_path),
+            output_filename="test_story.md",
+        )
 
-            # Verify result
-            assert result.total_subtasks == 0
-            assert result.subtasks == []
+        # Verify result
+        assert result.total_subtasks == 0
+        assert result.subtasks == []
+        mock_jira_instance.get_story_info.assert_awaited_once_with("PROJ-123")
+        mock_jira_instance.get_story_subtasks.assert_awaited_once_with("PROJ-123")
+        assert patches["open"].call_args.kwargs.get("buffering") == 1024 * 1024
 
 
 class TestMainFunction:
     """Test cases for the main CLI function."""
 
-    @patch("scripts.download_story_subtasks.asyncio.run")
+    @patch("scripts.download_story_subtasks.run_async")
     @patch("scripts.download_story_subtasks.print_success_message")
     @patch("scripts.download_story_subtasks.validate_settings")
     @patch("scripts.download_story_subtasks.setup_logging")
@@ -407,16 +429,17 @@ class TestMainFunction:
         mock_setup_logging,
         mock_validate_settings,
         mock_print_success,
-        mock_asyncio_run,
+        mock_run_async,
     ):
         """Test successful execution of main function."""
         # Setup mock result
-        mock_result = Mock()
-        mock_result.story_key = "PROJ-123"
-        mock_result.story_summary = "Test Story"
-        mock_result.total_subtasks = 2
-        mock_result.output_file = "test_output.md"
-        mock_asyncio_run.return_value = mock_result
+        mock_result = _FakeResult(
+            story_key="PROJ-123",
+            story_summary="Test Story",
+            total_subtasks=2,
+            output_file="test_output.md",
+        )
+        mock_run_async.return_value = mock_result
 
         # Import and run main with Click runner
         from click.testing import CliRunner
@@ -431,7 +454,7 @@ class TestMainFunction:
         mock_validate_settings.assert_called_once_with(False)
         mock_print_success.assert_called_once()
 
-    @patch("scripts.download_story_subtasks.asyncio.run")
+    @patch("scripts.download_story_subtasks.run_async")
     @patch("scripts.download_story_subtasks.handle_download_error")
     @patch("scripts.download_story_subtasks.validate_settings")
     @patch("scripts.download_story_subtasks.setup_logging")
@@ -440,11 +463,11 @@ class TestMainFunction:
         mock_setup_logging,
         mock_validate_settings,
         mock_handle_error,
-        mock_asyncio_run,
+        mock_run_async,
     ):
         """Test error handling in main function."""
         # Setup mock to raise exception
-        mock_asyncio_run.side_effect = Exception("Download failed")
+        mock_run_async.side_effect = Exception("Download failed")
 
         # Import and run main with Click runner
         from click.testing import CliRunner
@@ -457,7 +480,7 @@ class TestMainFunction:
         mock_handle_error.assert_called_once()
         assert "Download failed" in str(mock_handle_error.call_args[0][0])
 
-    @patch("scripts.download_story_subtasks.asyncio.run")
+    @patch("scripts.download_story_subtasks.run_async")
     @patch("scripts.download_story_subtasks.print_success_message")
     @patch("scripts.download_story_subtasks.validate_settings")
     @patch("scripts.download_story_subtasks.setup_logging")
@@ -466,16 +489,17 @@ class TestMainFunction:
         mock_setup_logging,
         mock_validate_settings,
         mock_print_success,
-        mock_asyncio_run,
+        mock_run_async,
     ):
         """Test main function with all options."""
         # Setup mock result
-        mock_result = Mock()
-        mock_result.story_key = "PROJ-123"
-        mock_result.story_summary = "Test Story"
-        mock_result.total_subtasks = 2
-        mock_result.output_file = "custom_output.md"
-        mock_asyncio_run.return_value = mock_result
+        mock_result = _FakeResult(
+            story_key="PROJ-123",
+            story_summary="Test Story",
+            total_subtasks=2,
+            output_file="custom_output.md",
+        )
+        mock_run_async.return_value = mock_result
 
         # Import and run main with Click runner
         from click.testing import CliRunner
@@ -499,9 +523,9 @@ class TestMainFunction:
         mock_setup_logging.assert_called_once_with(True)
         mock_validate_settings.assert_called_once_with(True)
 
-        # Verify asyncio.run was called with correct parameters
-        mock_asyncio_run.assert_called_once()
-        call_args = mock_asyncio_run.call_args[0][0]
+        # Verify run_async was called with correct parameters
+        mock_run_async.assert_called_once()
+        call_args = mock_run_async.call_args[0][0]
         # The call_args[0] should be a coroutine, but we can't easily inspect it
         # So we just verify the mock was called
 
@@ -509,8 +533,16 @@ class TestMainFunction:
 class TestIntegration:
     """Integration tests for the entire download flow."""
 
+    @pytest.fixture
+    def fake_open(self):
+        """An ``open`` replacement whose file lives in an in-memory buffer."""
+        buffer = io.StringIO()
+        opener = MagicMock()
+        opener.return_value.__enter__.return_value = buffer
+        return opener, buffer
+
     @pytest.mark.asyncio
-    async def test_full_download_flow(self, tmp_path):
+    async def test_full_download_flow(self, tmp_path, fake_open):
         """Test the complete download flow with mocked dependencies."""
         # Create mock objects instead of real Pydantic models
         mock_story = Mock()
@@ -576,10 +608,12 @@ class TestIntegration:
         ) as mock_ensure_dir, patch(
             "scripts.download_story_subtasks.get_file_size"
         ) as mock_get_size, patch(
-            "scripts.download_story_subtasks.extract_text_from_adf"
+            "src.utils.markdown_generators.extract_text_from_adf"
         ) as mock_extract_text, patch(
             "scripts.download_story_subtasks.StoryDownloadResult"
-        ) as mock_result_class:
+        ) as mock_result_class, patch(
+            "builtins.open", fake_open[0]
+        ):
 
             # Setup mocks
             mock_jira_instance = AsyncMock()
@@ -593,11 +627,12 @@ class TestIntegration:
             output_file = tmp_path / "integration_test.md"
 
             # Mock the result object
-            mock_result = Mock()
-            mock_result.story_key = "PROJ-123"
-            mock_result.story_summary = "Integration Test Story"
-            mock_result.total_subtasks = 1
-            mock_result.output_file = str(output_file)
+            mock_result = _FakeResult(
+                story_key="PROJ-123",
+                story_summary="Integration Test Story",
+                total_subtasks=1,
+                output_file=str(output_file),
+            )
             mock_result_class.return_value = mock_result
 
             # Test the download function
@@ -613,9 +648,10 @@ class TestIntegration:
             assert result.total_subtasks == 1
             assert result.output_file == str(output_file)
 
-            # Verify the markdown file was created with expected content
-            assert output_file.exists()
-            content = output_file.read_text(encoding="utf-8")
+            # Verify the markdown was written with expected content
+            fake_open[0].assert_called_once()
+            assert fake_open[0].call_args.args[0] == str(output_file)
+            content = fake_open[1].getvalue()
             assert "# Story: [PROJ-123]" in content
             assert "Integration Test Story" in content
             assert "Test Subtask" in content
@@ -0,0 +1,68 @@
+"""Tests for the JSON file helpers."""
+
+import json
+import math
+from datetime import datetime
+
+import pytest
+
+from src.utils.file_utils import load_json, save_json
+
+SAMPLE_DATA = {
+    "key": "PROJ-1",
+    "summary": "Résumé ✅",
+    "labels": ["a", "b"],
+    "fields": {"story_points": 3.5, "parent": None, "empty": {}, "none": []},
+    1: True,
+}
+
+
+class TestJsonFiles:
+    """Test cases for save_json and load_json."""
+
+    def test_default_indent_matches_stdlib_layout(self, tmp_path):
+        """Test that the orjson path writes the stdlib's two-space layout."""
+        path = tmp_path / "data.json"
+        save_json(SAMPLE_DATA, str(path))
+
+        expected = json.dumps(SAMPLE_DATA, indent=2, ensure_ascii=False)
+        assert path.read_text(encoding="utf-8") == expected
+        assert load_json(str(path)) == json.loads(expected)
+
+    def test_default_indent_writes_iso_datetimes_and_null_nan(self, tmp_path):
+        """Test the two documented differences of the orjson path."""
+        path = tmp_path / "data.json"
+        save_json(
+            {"created": datetime(2024, 1, 1, 9, 30), "points": float("nan")},
+            str(path),
+        )
+
+        assert load_json(str(path)) == {
+            "created": "2024-01-01T09:30:00",
+            "points": None,
+        }
+
+    @pytest.mark.parametrize("indent", [None, 0, 4])
+    def test_other_indents_use_stdlib_encoder(self, tmp_path, indent):
+        """Test that other indent levels keep the stdlib output unchanged."""
+        path = tmp_path / "data.json"
+        data = dict(SAMPLE_DATA, created=datetime(2024, 1, 1, 9, 30))
+        save_json(data, str(path), indent=indent)
+
+        expected = json.dumps(data, indent=indent, ensure_ascii=False, default=str)
+        assert path.read_text(encoding="utf-8") == expected
+
+    def test_load_json_reads_stdlib_nan(self, tmp_path):
+        """Test that NaN written by the stdlib encoder loads back."""
+        path = tmp_path / "data.json"
+        save_json({"points": float("nan")}, str(path), indent=4)
+
+        assert math.isnan(load_json(str(path))["points"])
+
+    def test_load_json_rejects_invalid_json(self, tmp_path):
+        """Test that invalid JSON raises json.JSONDecodeError."""
+        path = tmp_path / "data.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        with pytest.raises(json.JSONDecodeError):
+            load_json(str(path))
@@ -1,15 +1,62 @@
 """Tests for the Jira client."""
 
+import asyncio
+import gc
+import warnings
+import weakref
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from src.api.jira_client import JiraClient
+from src.api.jira_client import DEFAULT_ISSUE_FIELDS, JiraAPIError, JiraClient
 from src.models.jira_models import JiraIssue, JiraSearchResult
 
 
+def make_issue(key: str) -> JiraIssue:
+    """Build a minimal JiraIssue for client tests."""
+    return JiraIssue(
+        id=key.split("-")[1],
+        key=key,
+        self=f"https://test.atlassian.net/rest/api/3/issue/{key}",
+        fields={
+            "summary": f"Summary for {key}",
+            "status": {"id": "1", "name": "To Do", "statusCategory": {}},
+            "issuetype": {"id": "1", "name": "Task", "iconUrl": "https://icon"},
+            "project": {
+                "id": "1",
+                "key": "PROJ",
+                "name": "Project",
+                "projectTypeKey": "software",
+            },
+            "created": "2024-01-01T09:00:00.000+0000",
+            "updated": "2024-01-01T09:00:00.000+0000",
+        },
+    )
+
+
+def make_search_page(start_at: int, max_results: int, total: int) -> dict:
+    """Build a raw search response containing issues PROJ-<start_at+1>..."""
+    end = min(start_at + max_results, total)
+    return JiraSearchResult(
+        startAt=start_at,
+        maxResults=max_results,
+        total=total,
+        issues=[make_issue(f"PROJ-{i + 1}") for i in range(start_at, end)],
+    ).model_dump(by_alias=True)
+
+
 class TestJiraClient:
     """Test cases for JiraClient."""
 
+    @pytest.fixture
+    def client(self):
+        """Client with test credentials; no session is opened until used."""
+        return JiraClient(
+            url="https://test.atlassian.net",
+            username="test@example.com",
+            api_token="test-token",
+        )
+
     def test_init(self):
         """Test JiraClient initialization."""
         client = JiraClient(
@@ -22,6 +69,14 @@ class TestJiraClient:
         assert client.username == "test@example.com"
         assert client.api_token == "test-token"
         assert client.base_url == "https://test.atlassian.net/rest/api/3"
+        assert client.base_url is client.base_url
+
+        client = JiraClient(
+            url="https://test.atlassian.net/",
+            username="test@example.com",
+            api_token="test-token",
+        )
+        assert client.base_url == "https://test.atlassian.net/rest/api/3"
 
     @pytest.mark.asyncio
     async def test_get_session(self):
@@ -36,9 +91,91 @@ class TestJiraClient:
         assert session is not None
         assert session.auth.login == "test@example.com"
         assert session.auth.password == "test-token"
+        assert session.connector.limit_per_host == 64
+        assert "Accept-Encoding" not in session.headers
+        assert session.json_serialize({"jql": "ü"}) == '{"jql":"ü"}'
+        assert await client._get_session() is session
 
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_clients_share_connector(self, client):
+        """Test that open clients reuse one connection pool."""
+        second = JiraClient(
+            url="https://test.atlassian.net",
+            username="other@example.com",
+            api_token="other-token",
+        )
+
+        first_session = await client._get_session()
+        second_session = await second._get_session()
+        connector = first_session.connector
+        assert second_session.connector is connector
+
+        await client.close()
+        assert not connector.closed
+
+        await second.close()
+        assert connector.closed
+
+    def test_connectors_are_per_event_loop(self, client):
+        """Test that closing a client leaves other loops' pools open."""
+        second = JiraClient(
+            url="https://test.atlassian.net",
+            username="other@example.com",
+            api_token="other-token",
+        )
+        first_loop = asyncio.new_event_loop()
+        second_loop = asyncio.new_event_loop()
+        try:
+            first_session = first_loop.run_until_complete(client._get_session())
+            second_session = second_loop.run_until_complete(second._get_session())
+            first_connector = first_session.connector
+            second_connector = second_session.connector
+            assert first_connector is not second_connector
+
+            first_loop.run_until_complete(client.close())
+            assert first_connector.closed
+            assert not second_connector.closed
+
+            second_loop.run_until_complete(second.close())
+            assert second_connector.closed
+        finally:
+            first_loop.close()
+            second_loop.close()
+
+    def test_unclosed_clients_do_not_pin_event_loops(self):
+        """Test that the shared pool maps do not keep dead loops alive."""
+
+        async def open_session():
+            client = JiraClient(
+                url="https://test.atlassian.net",
+                username="test@example.com",
+                api_token="test-token",
+            )
+            await client._get_session()
+            return weakref.ref(asyncio.get_running_loop())
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", ResourceWarning)
+            loop_refs = [asyncio.run(open_session()) for _ in range(3)]
+            gc.collect()
+
+        assert all(loop_ref() is None for loop_ref in loop_refs)
+
+    @pytest.mark.asyncio
+    async def test_replacing_closed_session_keeps_one_pool_user(self, client):
+        """Test that a session closed outside close() is not counted twice."""
+        session = await client._get_session()
+        await session.close()
+        new_session = await client._get_session()
+        assert new_session is not session
+        connector = new_session.connector
+
+        await client.close()
+        assert connector.closed
+        assert asyncio.get_running_loop() not in JiraClient._connector_users
+
     @pytest.mark.asyncio
     async def test_context_manager(self):
         """Test JiraClient as async context manager."""
@@ -64,6 +201,247 @@ class TestJiraClient:
 
         assert expected_jql == '"Epic Link" = PROJ-123'
 
+    @pytest.mark.asyncio
+    async def test_get_epic_issues_fetches_remaining_pages(self, client):
+        """Test that pages after the first are requested by offset."""
+
+        async def fake_search(jql, fields=None, start_at=0, max_results=100):
+            return make_search_page(start_at, max_results, total=250)
+
+        with patch.object(
+            client, "search_issues_raw", AsyncMock(side_effect=fake_search)
+        ) as mock_search:
+            issues = await client.get_epic_issues("PROJ-1", batch_size=100)
+
+        assert len(issues) == 250
+        assert [issue.key for issue in issues[:2]] == ["PROJ-1", "PROJ-2"]
+        assert issues[-1].key == "PROJ-250"
+        offsets = sorted(call.kwargs["start_at"] for call in mock_search.call_args_list)
+        assert offsets == [0, 100, 200]
+        assert all(
+            call.kwargs["fields"] == DEFAULT_ISSUE_FIELDS
+            for call in mock_search.call_args_list
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_story_subtasks_falls_back_to_server_page_size(self, client):
+        """Test paging by the server's page size when it caps maxResults."""
+
+        async def fake_search(jql, fields=None, start_at=0, max_results=100):
+            # Simulate a server that never returns more than 100 per page
+            return make_search_page(start_at, min(max_results, 100), total=230)
+
+        with patch.object(
+            client, "search_issues_raw", AsyncMock(side_effect=fake_search)
+        ) as mock_search:
+            issues = await client.get_story_subtasks("PROJ-1", batch_size=500)
+
+        assert len(issues) == 230
+        assert len({issue.key for issue in issues}) == 230
+        offsets = sorted(call.kwargs["start_at"] for call in mock_search.call_args_list)
+        assert offsets == [0, 100, 200]
+
+    @pytest.mark.asyncio
+    async def test_get_story_subtasks_raw_skips_models(self, client):
+        """Test that the raw variant returns the JSON issue dictionaries."""
+        page = make_search_page(0, 100, total=2)
+
+        with patch.object(client, "_make_request", AsyncMock(return_value=page)):
+            issues = await client.get_story_subtasks_raw("PROJ-1")
+
+        assert issues == page["issues"]
+        assert all(isinstance(issue, dict) for issue in issues)
+
+    @pytest.mark.asyncio
+    async def test_get_issues_batches_keys(self, client):
+        """Test that many keys are fetched with chunked key-in searches."""
+
+        async def fake_search(jql, fields=None, start_at=0, max_results=100):
+            keys = jql[len("key in (") : -1].split(", ")
+            issues = [make_issue(key).model_dump(by_alias=True) for key in keys]
+            return {
+                "startAt": start_at,
+                "maxResults": max_results,
+                "total": len(issues),
+                "issues": issues,
+            }
+
+        keys = [f"PROJ-{i}" for i in range(1, 6)]
+        with patch.object(
+            client, "search_issues_raw", AsyncMock(side_effect=fake_search)
+        ) as mock_search:
+            issues = await client.get_issues(keys[::-1], chunk_size=2)
+
+        assert [issue.key for issue in issues] == keys[::-1]
+        assert mock_search.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_get_issues_skips_missing_and_invalid_keys(self, client):
+        """Test that a rejected chunk is retried key by key."""
+        existing = {"PROJ-1", "PROJ-2"}
+
+        async def fake_search(jql, fields=None, start_at=0, max_results=100):
+            keys = jql[len("key in (") : -1].split(", ")
+            if "BAD-1" in keys:
+                raise JiraAPIError(400, "The issue key 'BAD-1' is invalid")
+            issues = [
+                make_issue(key).model_dump(by_alias=True)
+                for key in keys
+                if key in existing
+            ]
+            return {
+                "startAt": start_at,
+                "maxResults": max_results,
+                "total": len(issues),
+                "issues": issues,
+            }
+
+        async def fake_request(method, endpoint, params=None, data=None):
+            key = endpoint[len("issue/") :]
+            if key not in existing:
+                raise JiraAPIError(404, "Issue does not exist")
+            return make_issue(key).model_dump(by_alias=True)
+
+        with patch.object(
+            client, "search_issues_raw", AsyncMock(side_effect=fake_search)
+        ), patch.object(
+            client, "_make_request", AsyncMock(side_effect=fake_request)
+        ) as mock_request:
+            issues = await client.get_issues(
+                ["PROJ-1", "PROJ-9", "PROJ-2", "BAD-1"], chunk_size=2
+            )
+
+        assert [issue.key for issue in issues] == ["PROJ-1", "PROJ-2"]
+        assert sorted(call.args[1] for call in mock_request.call_args_list) == [
+            "issue/BAD-1",
+            "issue/PROJ-2",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_issues_raises_other_api_errors(self, client):
+        """Test that errors other than a rejected query are not swallowed."""
+        with patch.object(
+            client,
+            "search_issues_raw",
+            AsyncMock(side_effect=JiraAPIError(401, "Unauthorized")),
+        ):
+            with pytest.raises(JiraAPIError):
+                await client.get_issues(["PROJ-1"])
+
+    @pytest.mark.asyncio
+    async def test_get_subtasks_for_stories_chunks_parent_search(self, client):
+        """Test that sub-tasks of many stories come from chunked parent-in searches."""
+
+        async def fake_search(jql, fields=None, start_at=0, max_results=100):
+            story_keys = jql[len("parent in (") : -1].split(", ")
+            issues = []
+            for story_key in story_keys:
+                if story_key == "PROJ-3":
+                    continue  # A story without sub-tasks
+                issue = make_issue(f"{story_key}0").model_dump(by_alias=True)
+                issue["fields"]["parent"] = {"key": story_key}
+                issues.append(issue)
+            return {
+                "startAt": start_at,
+                "maxResults": max_results,
+                "total": len(issues),
+                "issues": issues,
+            }
+
+        story_keys = [f"PROJ-{i}" for i in range(1, 6)]
+        with patch.object(
+            client, "search_issues_raw", AsyncMock(side_effect=fake_search)
+        ) as mock_search:
+            subtasks = await client.get_subtasks_for_stories(story_keys, chunk_size=2)
+
+        assert list(subtasks) == story_keys
+        assert subtasks["PROJ-3"] == []
+        assert [issue.key for issue in subtasks["PROJ-1"]] == ["PROJ-10"]
+        assert mock_search.call_count == 3
+        assert "parent" in mock_search.call_args.kwargs["fields"]
+
+    @pytest.mark.asyncio
+    async def test_get_issue_uses_cache(self, client):
+        """Test that repeated issue lookups are served from the cache."""
+        issue_data = make_issue("PROJ-1").model_dump(by_alias=True)
+
+        with patch.object(
+            client, "_make_request", AsyncMock(return_value=issue_data)
+        ) as mock_request:
+            first = await client.get_epic_info("PROJ-1")
+            second = await client.get_story_info("PROJ-1")
+            assert first is second
+            mock_request.assert_called_once_with("GET", "issue/PROJ-1")
+
+            client.invalidate_issue("PROJ-1")
+            await client.get_issue("PROJ-1")
+            assert mock_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_retries_on_429(self, client):
+        """Test that rate-limited requests are retried after Retry-After."""
+
+        def make_response(status, headers=None, payload=None):
+            response = MagicMock()
+            response.status = status
+            response.headers = headers or {}
+            response.json = AsyncMock(return_value=payload)
+            context = MagicMock()
+            context.__aenter__ = AsyncMock(return_value=response)
+            context.__aexit__ = AsyncMock(return_value=False)
+            return context
+
+        session = MagicMock()
+        session.request.side_effect = [
+            make_response(429, {"Retry-After": "0"}),
+            make_response(429, {"Retry-After": "0"}),
+            make_response(200, payload={"key": "PROJ-1"}),
+        ]
+
+        with patch.object(
+            client, "_get_session", AsyncMock(return_value=session)
+        ), patch("src.api.jira_client.asyncio.sleep", AsyncMock()) as mock_sleep:
+            data = await client._make_request("GET", "issue/PROJ-1")
+
+        assert data == {"key": "PROJ-1"}
+        assert session.request.call_count == 3
+        assert mock_sleep.await_count == 2
+        mock_sleep.assert_awaited_with(0.0)
+
+    @pytest.mark.asyncio
+    async def test_error_response_raises_jira_api_error(self, client):
+        """Test that HTTP error responses surface status and body."""
+        response = MagicMock()
+        response.status = 404
+        response.text = AsyncMock(return_value='{"errorMessages":["Not found"]}')
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=response)
+        context.__aexit__ = AsyncMock(return_value=False)
+        session = MagicMock()
+        session.request.return_value = context
+
+        with patch.object(client, "_get_session", AsyncMock(return_value=session)):
+            with pytest.raises(JiraAPIError) as exc_info:
+                await client._make_request("GET", "issue/PROJ-404")
+
+        assert exc_info.value.status == 404
+        assert exc_info.value.msg == '{"errorMessages":["Not found"]}'
+        assert "HTTP 404" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_retry_delay_falls_back_to_backoff(self):
+        """Test exponential backoff when Retry-After is missing or invalid."""
+        response = MagicMock()
+        response.headers = {}
+        assert JiraClient._retry_delay(response, 0) == 1.0
+        assert JiraClient._retry_delay(response, 2) == 4.0
+
+        response.headers = {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        assert JiraClient._retry_delay(response, 1) == 2.0
+
+        response.headers = {"Retry-After": "5"}
+        assert JiraClient._retry_delay(response, 3) == 5.0
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,55 @@
+"""Tests for the async rate limiter."""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.api.rate_limiter import AsyncRateLimiter
+
+
+class TestAsyncRateLimiter:
+    """Test cases for AsyncRateLimiter."""
+
+    def test_init_rejects_non_positive_rate(self):
+        """Test that a zero rate limit is rejected."""
+        with pytest.raises(ValueError):
+            AsyncRateLimiter(rate_limit=0)
+
+    def test_init_rejects_burst_below_one(self):
+        """Test that a burst capacity that cannot hold a token is rejected."""
+        with pytest.raises(ValueError):
+            AsyncRateLimiter(rate_limit=5, burst=0)
+
+    @pytest.mark.asyncio
+    async def test_burst_does_not_wait(self):
+        """Test that requests within the burst capacity start immediately."""
+        limiter = AsyncRateLimiter(rate_limit=5)
+
+        with patch(
+            "src.api.rate_limiter.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            for _ in range(5):
+                async with limiter:
+                    pass
+
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_waits_when_bucket_is_empty(self):
+        """Test that an empty bucket waits for a token to refill."""
+        limiter = AsyncRateLimiter(rate_limit=2, burst=1)
+        limiter._refill(0.0)
+        limiter._tokens = 0
+
+        clock = {"now": 0.0}
+
+        async def fake_sleep(delay):
+            clock["now"] += delay
+
+        with patch("src.api.rate_limiter.asyncio.get_running_loop") as mock_loop, patch(
+            "src.api.rate_limiter.asyncio.sleep", side_effect=fake_sleep
+        ) as mock_sleep:
+            mock_loop.return_value.time.side_effect = lambda: clock["now"]
+            await limiter.acquire()
+
+        mock_sleep.assert_called_once_with(0.5)
+        assert limiter._tokens == pytest.approx(0)